@@ -7,26 +7,42 @@ DATABASE_PATH = Path(__file__).parent / 'data' / 'crawler.db'
 
 def clear_database():
     """清空数据库中的所有数据"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-
-    # 获取所有表
-    tables = cursor.execute(
-        "SELECT name FROM sqlite_master WHERE type='table';"
-    ).fetchall()
-
-    # 删除每个表的数据（除了sqlite_sequence）
-    deleted_count = 0
-    for table in tables:
-        table_name = table[0]
-        if table_name != 'sqlite_sequence':
-            cursor.execute(f'DELETE FROM {table_name}')
-            deleted_count += 1
-            print(f"已清空表: {table_name}")
-
-    conn.commit()
-    conn.close()
-    print(f"\n总计清空了 {deleted_count} 个表的数据")
+    # 手动管理事务，所有 DELETE 在同一个事务中提交
+    conn = sqlite3.connect(DATABASE_PATH, isolation_level=None)
+
+    try:
+        # 清空操作无需持久化回滚日志，也无需每条语句 fsync
+        conn.execute('PRAGMA journal_mode=MEMORY')
+        conn.execute('PRAGMA synchronous=OFF')
+        conn.execute('BEGIN IMMEDIATE')
+
+        # 获取所有用户表（排除 sqlite_sequence 等内部表）
+        tables = [name for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+        )]
+
+        # 不带 WHERE 的 DELETE 会走 SQLite 的截断优化，不逐行删除
+        for table_name in tables:
+            conn.execute(f'DELETE FROM "{table_name}"')
+
+        # 重置自增ID
+        has_sequence = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_sequence'"
+        ).fetchone()
+        if has_sequence:
+            conn.execute('DELETE FROM sqlite_sequence')
+
+        conn.commit()
+
+        # 回收已释放的页面
+        conn.execute('VACUUM')
+    finally:
+        conn.close()
+
+    for table_name in tables:
+        print(f"已清空表: {table_name}")
+
+    print(f"\n总计清空了 {len(tables)} 个表的数据")
     print("数据库清空完成!")
 
 if __name__ == '__main__':
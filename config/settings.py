@@ -17,6 +17,9 @@ DATABASE_PATH = DATA_DIR / "crawler.db"
 # Feishu settings
 FEISHU_WEBHOOK_URL = os.getenv("FEISHU_WEBHOOK_URL", "")
 FEISHU_SECRET = os.getenv("FEISHU_SECRET", "")
+FEISHU_BATCH_SIZE = 10  # news queued by send_news before they go out as one card
+FEISHU_BATCH_INTERVAL = 5  # seconds the oldest queued news may wait before a send
+FEISHU_USE_HTTP2 = False  # send webhook messages over HTTP/2 (requires httpx[http2])
 
 # Crawler settings
 USER_AGENTS = [
@@ -27,9 +30,16 @@ USER_AGENTS = [
 ]
 
 REQUEST_TIMEOUT = 30  # seconds
-REQUEST_DELAY_MIN = 1  # seconds
-REQUEST_DELAY_MAX = 3  # seconds
 MAX_RETRIES = 3
+HTTP_POOL_SIZE = 32  # pooled keep-alive connections per host (sync sessions)
+USE_HTTP2 = False  # multiplex sync requests over HTTP/2 (requires httpx[http2])
+MAX_CONCURRENT_REQUESTS = 16  # in-flight requests across all hosts (async crawls)
+HOST_MIN_INTERVAL = 0  # default seconds between requests to one host
+HOST_BACKOFF_MAX = 60  # cap for the adaptive per-host interval after 429/5xx
+HOST_RATE_LIMITS = {
+    "export.arxiv.org": 3.0,  # arXiv API terms: one request every 3 seconds
+}
+DNS_CACHE_TTL = 600  # seconds to reuse a resolved host address
 
 # Logging settings
 LOG_LEVEL = "INFO"
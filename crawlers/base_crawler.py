@@ -2,83 +2,283 @@
 Base crawler class with error handling and retry logic
 """
 import time
+import atexit
 import random
+import socket
+import asyncio
 import logging
-from typing import Optional, Dict, Any
+import threading
+import ipaddress
+from typing import Optional, Dict, Any, List, Mapping
 from abc import ABC, abstractmethod
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import aiohttp
+except ImportError:  # crawlers fall back to threaded requests
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # HTTP/2 is opt-in via USE_HTTP2
+    httpx = None
+
 from config.settings import (
     USER_AGENTS,
     REQUEST_TIMEOUT,
-    REQUEST_DELAY_MIN,
-    REQUEST_DELAY_MAX,
-    MAX_RETRIES
+    MAX_RETRIES,
+    HTTP_POOL_SIZE,
+    USE_HTTP2,
+    MAX_CONCURRENT_REQUESTS,
+    HOST_MIN_INTERVAL,
+    HOST_BACKOFF_MAX,
+    HOST_RATE_LIMITS,
+    DNS_CACHE_TTL
 )
 
 logger = logging.getLogger(__name__)
 
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Transport errors of whichever sync client the session was built from
+FETCH_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Delay in seconds or None if missing/unparseable
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_dns_cache: Dict[tuple, tuple] = {}
+_dns_cache_lock = threading.Lock()
+_orig_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, *args, **kwargs):
+    """
+    socket.getaddrinfo with a process-wide TTL cache
+
+    The crawlers hit the same few hosts over and over, so cold connections in
+    the requests pools would otherwise pay a fresh DNS lookup every time.
+    IP literals and failed lookups are passed through uncached.
+    """
+    if not host:
+        return _orig_getaddrinfo(host, *args, **kwargs)
+
+    try:
+        ipaddress.ip_address(host.decode() if isinstance(host, bytes) else host)
+        return _orig_getaddrinfo(host, *args, **kwargs)
+    except ValueError:
+        pass
+
+    key = (host, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+
+    with _dns_cache_lock:
+        cached = _dns_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    result = _orig_getaddrinfo(host, *args, **kwargs)
+    with _dns_cache_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, result)
+    return result
+
+
+socket.getaddrinfo = _cached_getaddrinfo
+
 
 class BaseCrawler(ABC):
     """Base crawler class"""
 
+    # BeautifulSoup tree builder; subclasses may override
+    PARSER = 'lxml'
+
+    # One pooled sync session shared by every crawler in the process, so
+    # hosts crawled by several crawlers reuse the same warm connections
+    _shared_session = None
+    _shared_session_lock = threading.Lock()
+
     def __init__(self):
         """Initialize crawler"""
         self.session = self._create_session()
 
-    def _create_session(self) -> requests.Session:
-        """Create requests session with retry strategy"""
+        # Worker threads get their own sessions (see _get_session)
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()
+        self._thread_sessions: List[Any] = []
+
+        # Static request headers; only the User-Agent rotates per request
+        self._base_headers = {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+        }
+
+        # Async concurrency cap (recreated per crawl_async call since
+        # asyncio primitives bind to the event loop that first uses them)
+        self._sem: Optional[asyncio.Semaphore] = None
+
+        # Per-host throttling shared by the sync and async paths: the
+        # earliest time of the next request and the adaptive interval
+        self._host_lock = threading.Lock()
+        self._host_next_request: Dict[str, float] = {}
+        self._host_min_interval: Dict[str, float] = {}
+
+    @classmethod
+    def _create_session(cls):
+        """
+        Get the process-wide sync session, creating it on first use
+
+        The session is closed at interpreter exit rather than by close().
+
+        Returns:
+            Shared sync HTTP session (see _build_session)
+        """
+        with BaseCrawler._shared_session_lock:
+            if BaseCrawler._shared_session is None:
+                BaseCrawler._shared_session = cls._build_session()
+                atexit.register(BaseCrawler._shared_session.close)
+            return BaseCrawler._shared_session
+
+    @classmethod
+    def _build_session(cls):
+        """
+        Create a new sync HTTP session
+
+        Returns:
+            httpx.Client speaking HTTP/2 when USE_HTTP2 is set and httpx[http2]
+            is installed, otherwise a requests.Session with retry strategy
+        """
+        if USE_HTTP2 and httpx is not None:
+            try:
+                return cls._create_http2_session()
+            except ImportError as e:
+                logger.warning(f"HTTP/2 unavailable, falling back to requests: {e}")
+
         session = requests.Session()
 
-        # Configure retry strategy
+        # Configure retry strategy for connection failures only; retryable
+        # statuses (and Retry-After) are handled by fetch_url so they feed
+        # the per-host backoff
         retry_strategy = Retry(
             total=MAX_RETRIES,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
+            allowed_methods=["HEAD", "GET", "OPTIONS"],
+            respect_retry_after_header=False,
+            raise_on_status=False
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the pool so repeated requests to the same host reuse
+        # keep-alive connections instead of paying a new TCP/TLS handshake
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            pool_block=False
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         return session
 
+    @staticmethod
+    def _create_http2_session() -> 'httpx.Client':
+        """Create httpx client multiplexing requests per host over HTTP/2"""
+        # Transport-level retries only cover connection failures; retryable
+        # statuses are retried by fetch_url
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=MAX_RETRIES,
+            limits=httpx.Limits(max_connections=HTTP_POOL_SIZE * 2,
+                                max_keepalive_connections=HTTP_POOL_SIZE)
+        )
+        return httpx.Client(transport=transport, timeout=REQUEST_TIMEOUT, follow_redirects=True)
+
+    def _get_session(self):
+        """
+        Get the requests session for the calling thread
+
+        The crawler's own thread uses self.session; pool workers lazily get a
+        session of their own so adapters are never shared across threads.
+
+        Returns:
+            Sync HTTP session (see _create_session)
+        """
+        if threading.get_ident() == self._owner_thread:
+            return self.session
+
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._build_session()
+            with self._host_lock:
+                self._thread_sessions.append(session)
+        return session
+
+    def _enabled_sources(self, sources: List[dict]) -> List[dict]:
+        """
+        Drop disabled sources, logging how many were skipped
+
+        Args:
+            sources: Source configurations
+
+        Returns:
+            Enabled source configurations
+        """
+        enabled = [source for source in sources if source.get('enabled', False)]
+        skipped = len(sources) - len(enabled)
+        if skipped:
+            logger.info(f"{self.__class__.__name__}: skipping {skipped} disabled source(s)")
+        return enabled
+
     def _get_headers(self) -> Dict[str, str]:
         """Get random headers"""
-        return {
-            'User-Agent': random.choice(USER_AGENTS),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
-
-    def _random_delay(self):
-        """Add random delay to avoid being blocked"""
-        delay = random.uniform(REQUEST_DELAY_MIN, REQUEST_DELAY_MAX)
-        time.sleep(delay)
+        headers = self._base_headers.copy()
+        headers['User-Agent'] = random.choice(USER_AGENTS)
+        return headers
 
-    def fetch_url(self, url: str, method: str = 'GET', **kwargs) -> Optional[requests.Response]:
+    def fetch_url(self, url: str, method: str = 'GET', **kwargs):
         """
         Fetch URL with error handling
 
         Args:
             url: URL to fetch
             method: HTTP method (GET, POST, etc.)
-            **kwargs: Additional arguments for requests
+            **kwargs: Additional arguments for the session's request()
 
         Returns:
-            Response object or None if failed
+            requests/httpx Response object or None if failed
         """
-        try:
-            # Add random delay
-            self._random_delay()
+        host = urlparse(url).netloc
 
+        try:
             # Set default headers if not provided
             if 'headers' not in kwargs:
                 kwargs['headers'] = self._get_headers()
@@ -87,14 +287,147 @@ class BaseCrawler(ABC):
             if 'timeout' not in kwargs:
                 kwargs['timeout'] = REQUEST_TIMEOUT
 
-            # Make request
-            logger.info(f"Fetching {url}")
-            response = self.session.request(method, url, **kwargs)
-            response.raise_for_status()
+            session = self._get_session()
+
+            # Session transports only retry connection failures, so
+            # retryable statuses are retried here after the host backoff
+            for attempt in range(MAX_RETRIES + 1):
+                # Wait only if this host is being rate limited
+                wait = self._reserve_host_slot(host)
+                if wait > 0:
+                    time.sleep(wait)
 
-            return response
+                # Make request
+                logger.debug("Fetching %s", url)
+                response = session.request(method, url, **kwargs)
+                self._record_host_response(host, response.status_code, response.headers)
 
-        except requests.exceptions.RequestException as e:
+                if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                    continue
+
+                response.raise_for_status()
+                return response
+
+        except FETCH_ERRORS as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+
+    def _create_async_session(self) -> 'aiohttp.ClientSession':
+        """Create aiohttp session with a pooled, DNS-caching connector"""
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=8,
+                                        use_dns_cache=True, ttl_dns_cache=DNS_CACHE_TTL)
+        return aiohttp.ClientSession(connector=connector)
+
+    def _host_interval(self, host: str) -> float:
+        """Get current minimum seconds between two requests to the same host"""
+        return self._host_min_interval.get(host, HOST_RATE_LIMITS.get(host, HOST_MIN_INTERVAL))
+
+    def _reserve_host_slot(self, host: str) -> float:
+        """
+        Reserve the next request slot for host
+
+        Args:
+            host: Host about to be requested
+
+        Returns:
+            Seconds to wait before sending the request (0 if none)
+        """
+        with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_request.get(host, 0.0))
+            self._host_next_request[host] = start + self._host_interval(host)
+            return start - now
+
+    async def _wait_for_host(self, host: str):
+        """Sleep until the rate-limit window for host allows another request"""
+        wait = self._reserve_host_slot(host)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _record_host_response(self, host: str, status: int, headers: Mapping[str, str]):
+        """
+        Adapt the request interval for host from the response it returned
+
+        The interval doubles while the host answers 429/5xx and decays back
+        toward its configured base once requests succeed again.
+
+        Args:
+            host: Host the response came from
+            status: HTTP status code
+            headers: Response headers
+        """
+        base = HOST_RATE_LIMITS.get(host, HOST_MIN_INTERVAL)
+        retry_after = _parse_retry_after(headers.get('Retry-After'))
+        delay = None
+
+        with self._host_lock:
+            interval = self._host_interval(host)
+
+            if status in RETRY_STATUS_CODES:
+                interval = min(max(interval * 2, 1.0), HOST_BACKOFF_MAX)
+                self._host_min_interval[host] = interval
+                delay = retry_after if retry_after is not None else interval
+            elif headers.get('X-RateLimit-Remaining') == '0':
+                delay = retry_after if retry_after is not None else interval
+            elif interval > base:
+                interval /= 2
+                if interval - base < 0.1:
+                    del self._host_min_interval[host]
+                else:
+                    self._host_min_interval[host] = interval
+
+            if delay is not None:
+                next_request = time.monotonic() + delay
+                if next_request > self._host_next_request.get(host, 0.0):
+                    self._host_next_request[host] = next_request
+
+        if delay is not None:
+            logger.warning(f"Rate limited by {host} (HTTP {status}), backing off {delay:.1f}s")
+
+    async def fetch_url_async(self, session: 'aiohttp.ClientSession', url: str,
+                              method: str = 'GET', **kwargs) -> Optional[bytes]:
+        """
+        Fetch URL asynchronously with concurrency cap and per-host rate limiting
+
+        Args:
+            session: aiohttp session to issue the request on
+            url: URL to fetch
+            method: HTTP method (GET, POST, etc.)
+            **kwargs: Additional arguments for aiohttp
+
+        Returns:
+            Raw response body or None if failed (left undecoded so the
+            parser can sniff the charset itself)
+        """
+        host = urlparse(url).netloc
+
+        # Set default headers if not provided
+        if 'headers' not in kwargs:
+            kwargs['headers'] = self._get_headers()
+
+        # Set timeout if not provided
+        if 'timeout' not in kwargs:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                await self._wait_for_host(host)
+
+                async with self._sem:
+                    logger.debug("Fetching %s", url)
+                    async with session.request(method, url, **kwargs) as response:
+                        self._record_host_response(host, response.status, response.headers)
+
+                        if response.status in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                            continue
+
+                        response.raise_for_status()
+                        return await response.read()
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
@@ -133,10 +466,12 @@ class BaseCrawler(ABC):
         pass
 
     def close(self):
-        """Close session"""
-        if self.session:
-            self.session.close()
-            logger.info(f"{self.__class__.__name__} session closed")
+        """Close worker-thread sessions; the shared session stays open until exit"""
+        for session in self._thread_sessions:
+            session.close()
+        self._thread_sessions.clear()
+
+        logger.debug(f"{self.__class__.__name__} released shared session")
 
     def __enter__(self):
         """Context manager enter"""
@@ -145,3 +480,38 @@ class BaseCrawler(ABC):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.close()
+
+
+class AsyncCrawlerMixin(ABC):
+    """Async crawling for BaseCrawler subclasses whose sources support it"""
+
+    async def crawl_async(self, *args, **kwargs):
+        """
+        Async crawl entrypoint backed by a shared aiohttp session
+
+        Args:
+            *args: Crawler-specific arguments
+            **kwargs: Crawler-specific arguments
+
+        Returns:
+            List of crawled items
+        """
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async with self._create_async_session() as session:
+            return await self._crawl_with_session(session, *args, **kwargs)
+
+    @abstractmethod
+    async def _crawl_with_session(self, session: 'aiohttp.ClientSession', *args, **kwargs):
+        """
+        Async crawl implementation to be provided by subclasses
+
+        Args:
+            session: aiohttp session for all requests of this crawl
+            *args: Crawler-specific arguments
+            **kwargs: Crawler-specific arguments
+
+        Returns:
+            List of crawled items
+        """
+        pass
@@ -1,18 +1,64 @@
 """
 News crawler module
 """
+import asyncio
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Tuple
 from datetime import datetime
+from urllib.parse import quote, urljoin
+
+import soupsieve
 from bs4 import BeautifulSoup
 
-from crawlers.base_crawler import BaseCrawler
+from config.settings import MAX_CONCURRENT_REQUESTS
+from crawlers.base_crawler import AsyncCrawlerMixin, BaseCrawler, aiohttp
 from database.models import News
 
 logger = logging.getLogger(__name__)
 
+_KR_BASE_URL = 'https://www.36kr.com'
+
+# Selector tables, built once instead of per article and per source
+_KR_ARTICLE_SELECTOR = soupsieve.compile('div.article-item, div.newsflash-item')
+_KR_TITLE_TAGS = ('h3', 'h2', 'a')
+_KR_SUMMARY_CLASSES = frozenset({'summary', 'article-desc'})
+_KR_DATE_CLASSES = frozenset({'time', 'date'})
+
+_ARTICLE_TAGS = ('article', 'div')
+_ARTICLE_CLASSES = frozenset({'news-item', 'article', 'post', 'item'})
+_LIST_ITEM_CLASSES = frozenset({'list-item', 'news', 'item'})
+_CONTAINER_CLASS_HINTS = ('news', 'article', 'post', 'item', 'card')
+
+# Strategies 1-3 of the article search unioned into one selector, so the
+# tree is walked once (class hints match case-insensitively like before)
+_ARTICLE_SELECTOR = soupsieve.compile(', '.join(
+    [f'{tag}.{cls}' for tag in _ARTICLE_TAGS for cls in sorted(_ARTICLE_CLASSES)] +
+    [f'li.{cls}' for cls in sorted(_LIST_ITEM_CLASSES)] +
+    [f'div[class*="{hint}" i]' for hint in _CONTAINER_CLASS_HINTS]
+))
+
+# crawl_single_source fallbacks, tried in order
+_SINGLE_SOURCE_SELECTORS = tuple(soupsieve.compile(selector) for selector in (
+    'article.news-item, article.article, article.post, div.news-item, div.article, div.post',
+    'li.list-item, li.news',
+    'div.item',
+))
+
+_TITLE_TAGS = ('h1', 'h2', 'h3', 'h4', 'a')
+_TITLE_CLASSES = frozenset({'title', 'heading'})
+_SUMMARY_TAGS = ('p', 'div')
+_SUMMARY_CLASSES = frozenset({'summary', 'desc', 'description', 'excerpt'})
+_DATE_TAGS = ('time', 'span')
+_DATE_CLASSES = frozenset({'date', 'time', 'publish-time'})
+
+
+def _absolutize(url: str, base_url: str) -> str:
+    """Resolve a possibly relative article link against base_url"""
+    return urljoin(base_url, url) if url else ''
 
-class NewsCrawler(BaseCrawler):
+
+class NewsCrawler(AsyncCrawlerMixin, BaseCrawler):
     """News crawler class"""
 
     def __init__(self):
@@ -30,34 +76,115 @@ class NewsCrawler(BaseCrawler):
         Returns:
             List of News objects
         """
-        all_news = []
+        sources = self._enabled_sources(sources)
+        if not sources:
+            return []
 
-        for source in sources:
-            if not source.get('enabled', False):
-                logger.info(f"Skipping disabled source: {source['name']}")
-                continue
+        if aiohttp is None:
+            return self._crawl_threaded(sources, keywords)
 
-            logger.info(f"Crawling news from: {source['name']}")
+        return asyncio.run(self.crawl_async(sources, keywords))
 
-            try:
-                if source.get('type') == 'api':
-                    news_items = self._crawl_api_source(source, keywords)
-                else:
-                    news_items = self._crawl_html_source(source, keywords)
+    def _crawl_threaded(self, sources: List[dict], keywords: List[str]) -> List[News]:
+        """
+        Crawl all sources concurrently on a thread pool (used without aiohttp)
+
+        Args:
+            sources: List of news source configurations
+            keywords: List of keywords to search
+
+        Returns:
+            List of News objects
+        """
+        all_news = []
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            futures = {}
+            for source in sources:
+                logger.info(f"Crawling news from: {source['name']}")
+                futures[executor.submit(self._crawl_one, source, keywords)] = source
+
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    news_items = future.result()
+                except Exception as e:
+                    logger.error(f"Error crawling {source['name']}: {e}")
+                    continue
 
                 all_news.extend(news_items)
                 logger.info(f"Crawled {len(news_items)} news from {source['name']}")
 
-            except Exception as e:
-                logger.error(f"Error crawling {source['name']}: {e}")
+        return all_news
+
+    def _crawl_one(self, source: dict, keywords: List[str]) -> List[News]:
+        """
+        Crawl a single news source synchronously
+
+        Args:
+            source: Source configuration
+            keywords: Keywords to search
+
+        Returns:
+            List of News objects
+        """
+        if source.get('type') == 'api':
+            search_urls, articles_per_page = self._api_search_urls(source, keywords)
+            news_items = []
+            for url in search_urls:
+                response = self.fetch_url(url)
+                if response:
+                    news_items.extend(self._parse_api_page(response.content, source, articles_per_page))
+            return news_items
+
+        response = self.fetch_url(source.get('search_url', source['base_url']))
+        if not response:
+            return []
+        return self._parse_html_page(response.content, source)
+
+    async def _crawl_with_session(self, session: 'aiohttp.ClientSession',
+                                  sources: List[dict], keywords: List[str]) -> List[News]:
+        """
+        Crawl all sources concurrently on one aiohttp session
+
+        Args:
+            session: aiohttp session
+            sources: List of news source configurations
+            keywords: List of keywords to search
+
+        Returns:
+            List of News objects
+        """
+        all_news = []
+        tasks = []
+
+        for source in sources:
+            logger.info(f"Crawling news from: {source['name']}")
+
+            if source.get('type') == 'api':
+                tasks.append(self._crawl_api_source(session, source, keywords))
+            else:
+                tasks.append(self._crawl_html_source(session, source, keywords))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for source, news_items in zip(sources, results):
+            if isinstance(news_items, Exception):
+                logger.error(f"Error crawling {source['name']}: {news_items}")
+                continue
+
+            all_news.extend(news_items)
+            logger.info(f"Crawled {len(news_items)} news from {source['name']}")
 
         return all_news
 
-    def _crawl_api_source(self, source: dict, keywords: List[str]) -> List[News]:
+    async def _crawl_api_source(self, session: 'aiohttp.ClientSession',
+                                source: dict, keywords: List[str]) -> List[News]:
         """
         Crawl news from API source (e.g., 36Kr)
 
         Args:
+            session: aiohttp session
             source: Source configuration
             keywords: Keywords to search
 
@@ -65,36 +192,74 @@ class NewsCrawler(BaseCrawler):
             List of News objects
         """
         news_items = []
+        search_urls, articles_per_page = self._api_search_urls(source, keywords)
 
-        # For 36Kr, we'll search for each keyword
-        for keyword in keywords[:5]:  # Limit to 5 keywords to avoid too many requests
-            search_url = source['search_url'].format(keyword=keyword)
+        pages = await asyncio.gather(*[self.fetch_url_async(session, url) for url in search_urls])
 
-            # 36Kr uses an API endpoint, adjust URL accordingly
-            # Note: This is a simplified implementation
-            # Real 36Kr API might need authentication or different endpoint
-            response = self.fetch_url(search_url)
+        for html in pages:
+            if html:
+                news_items.extend(self._parse_api_page(html, source, articles_per_page))
 
-            if not response:
-                continue
+        return news_items
 
-            try:
-                # Try to parse as HTML first (since 36Kr might return HTML)
-                soup = BeautifulSoup(response.text, 'html.parser')
+    def _api_search_urls(self, source: dict, keywords: List[str]) -> Tuple[List[str], int]:
+        """
+        Build the search URLs for an API source
 
-                # Find article elements (adjust selectors based on actual site structure)
-                articles = soup.find_all('div', class_=['article-item', 'newsflash-item'])
+        Args:
+            source: Source configuration
+            keywords: Keywords to search
 
-                for article in articles[:5]:  # Limit to 5 articles per keyword
-                    try:
-                        news = self._parse_36kr_article(article, source['name'])
-                        if news:
-                            news_items.append(news)
-                    except Exception as e:
-                        logger.error(f"Error parsing article: {e}")
+        Returns:
+            Tuple of (search URLs, articles to keep per page)
+        """
+        # Limit to 5 keywords to avoid too many requests
+        query_keywords = keywords[:5]
+
+        if source.get('supports_or'):
+            # Source accepts boolean queries: one OR'd request covers all keywords
+            search_urls = [source['search_url'].format(keyword=' OR '.join(quote(k) for k in query_keywords))]
+            return search_urls, 5 * len(query_keywords)
+
+        # For 36Kr, we'll search for each keyword concurrently
+        format_url = source['search_url'].format
+        search_urls = [format_url(keyword=keyword) for keyword in query_keywords]
+        return search_urls, 5
+
+    def _parse_api_page(self, html: bytes, source: dict, articles_per_page: int) -> List[News]:
+        """
+        Parse one search result page of an API source
+
+        Args:
+            html: Raw page body
+            source: Source configuration
+            articles_per_page: Maximum number of articles to keep
 
-            except Exception as e:
-                logger.error(f"Error processing response from {source['name']}: {e}")
+        Returns:
+            List of News objects
+        """
+        news_items = []
+
+        # 36Kr uses an API endpoint, adjust URL accordingly
+        # Note: This is a simplified implementation
+        # Real 36Kr API might need authentication or different endpoint
+        try:
+            # Try to parse as HTML first (since 36Kr might return HTML)
+            soup = BeautifulSoup(html, self.PARSER)
+
+            # Find article elements (adjust selectors based on actual site structure)
+            articles = _KR_ARTICLE_SELECTOR.select(soup, limit=articles_per_page)
+
+            for article in articles:  # Limit to 5 articles per keyword
+                try:
+                    news = self._parse_36kr_article(article, source['name'])
+                    if news:
+                        news_items.append(news)
+                except Exception as e:
+                    logger.error(f"Error parsing article: {e}")
+
+        except Exception as e:
+            logger.error(f"Error processing response from {source['name']}: {e}")
 
         return news_items
 
@@ -111,7 +276,7 @@ class NewsCrawler(BaseCrawler):
         """
         try:
             # Extract title and URL
-            title_elem = article.find(['h3', 'h2', 'a'])
+            title_elem = article.find(_KR_TITLE_TAGS)
             if not title_elem:
                 return None
 
@@ -122,16 +287,14 @@ class NewsCrawler(BaseCrawler):
                 link_elem = article.find('a')
                 url = link_elem.get('href', '') if link_elem else ''
 
-            # Make URL absolute
-            if url and not url.startswith('http'):
-                url = f"https://www.36kr.com{url}"
+            url = _absolutize(url, _KR_BASE_URL)
 
             # Extract summary
-            summary_elem = article.find(['p', 'div'], class_=['summary', 'article-desc'])
+            summary_elem = article.find(_SUMMARY_TAGS, class_=_KR_SUMMARY_CLASSES)
             summary = summary_elem.get_text(strip=True) if summary_elem else ""
 
             # Extract publish date (if available)
-            date_elem = article.find(['time', 'span'], class_=['time', 'date'])
+            date_elem = article.find(_DATE_TAGS, class_=_KR_DATE_CLASSES)
             publish_date = date_elem.get_text(strip=True) if date_elem else None
 
             if not title or not url:
@@ -152,47 +315,49 @@ class NewsCrawler(BaseCrawler):
             logger.error(f"Error parsing 36Kr article: {e}")
             return None
 
-    def _crawl_html_source(self, source: dict, keywords: List[str]) -> List[News]:
+    async def _crawl_html_source(self, session: 'aiohttp.ClientSession',
+                                 source: dict, keywords: List[str]) -> List[News]:
         """
         Crawl news from HTML source
 
         Args:
+            session: aiohttp session
             source: Source configuration
             keywords: Keywords (not used for HTML sources, they browse latest news)
 
         Returns:
             List of News objects
         """
-        news_items = []
-
         # Fetch the news page
         url = source.get('search_url', source['base_url'])
-        response = self.fetch_url(url)
+        html = await self.fetch_url_async(session, url)
 
-        if not response:
-            return news_items
+        if not html:
+            return []
 
-        try:
-            soup = BeautifulSoup(response.text, 'html.parser')
+        return self._parse_html_page(html, source)
 
-            # Try multiple selector strategies
-            articles = []
+    def _parse_html_page(self, html: bytes, source: dict) -> List[News]:
+        """
+        Extract articles from a news listing page
 
-            # Strategy 1: Look for common article containers
-            articles = soup.find_all(['article', 'div'], class_=['news-item', 'article', 'post', 'item'])
+        Args:
+            html: Raw page body
+            source: Source configuration
 
-            if not articles:
-                # Strategy 2: Look for list items
-                articles = soup.find_all('li', class_=['list-item', 'news', 'item'])
+        Returns:
+            List of News objects
+        """
+        news_items = []
 
-            if not articles:
-                # Strategy 3: Look for divs with 'news' or 'article' in class name
-                all_divs = soup.find_all('div', class_=True)
-                articles = [d for d in all_divs if any(kw in ' '.join(d.get('class', [])).lower()
-                           for kw in ['news', 'article', 'post', 'item', 'card'])][:20]
+        try:
+            soup = BeautifulSoup(html, self.PARSER)
+
+            # Article containers, list items and news-like divs in one pass
+            articles = _ARTICLE_SELECTOR.select(soup, limit=20)
 
             if not articles:
-                # Strategy 4: Find all links with titles
+                # Fallback: Find all links with titles
                 links_with_titles = soup.find_all('a', href=True)
                 # Filter links that look like article links
                 articles = [link.parent for link in links_with_titles
@@ -227,7 +392,7 @@ class NewsCrawler(BaseCrawler):
         """
         try:
             # Find title and URL
-            title_elem = article.find(['h1', 'h2', 'h3', 'h4', 'a'], class_=['title', 'heading'])
+            title_elem = article.find(_TITLE_TAGS, class_=_TITLE_CLASSES)
             if not title_elem:
                 title_elem = article.find('a')
 
@@ -241,19 +406,14 @@ class NewsCrawler(BaseCrawler):
                 link_elem = article.find('a')
                 url = link_elem.get('href', '') if link_elem else ''
 
-            # Make URL absolute
-            if url and not url.startswith('http'):
-                if url.startswith('/'):
-                    url = f"{base_url}{url}"
-                else:
-                    url = f"{base_url}/{url}"
+            url = _absolutize(url, base_url)
 
             # Extract summary/description
-            summary_elem = article.find(['p', 'div'], class_=['summary', 'desc', 'description', 'excerpt'])
+            summary_elem = article.find(_SUMMARY_TAGS, class_=_SUMMARY_CLASSES)
             summary = summary_elem.get_text(strip=True) if summary_elem else ""
 
             # Extract date
-            date_elem = article.find(['time', 'span'], class_=['date', 'time', 'publish-time'])
+            date_elem = article.find(_DATE_TAGS, class_=_DATE_CLASSES)
             publish_date = None
             if date_elem:
                 publish_date = date_elem.get_text(strip=True)
@@ -299,14 +459,14 @@ class NewsCrawler(BaseCrawler):
             if not response:
                 return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, self.PARSER)
 
             # Try multiple selectors
-            articles = (
-                soup.find_all(['article', 'div'], class_=['news-item', 'article', 'post'], limit=max_items) or
-                soup.find_all('li', class_=['list-item', 'news'], limit=max_items) or
-                soup.find_all('div', class_=['item'], limit=max_items)
-            )
+            articles = []
+            for selector in _SINGLE_SOURCE_SELECTORS:
+                articles = selector.select(soup, limit=max_items)
+                if articles:
+                    break
 
             news_items = []
             for article in articles:
@@ -2,25 +2,41 @@
 Academic paper crawler module (arXiv)
 """
 import logging
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime, timedelta
-import xml.etree.ElementTree as ET
-from urllib.parse import quote
+from io import BytesIO
+from urllib.parse import quote, urlencode
+
+from lxml import etree
 
 from crawlers.base_crawler import BaseCrawler
 from database.models import Paper
 
 logger = logging.getLogger(__name__)
 
+_ATOM_URI = 'http://www.w3.org/2005/Atom'
+_ARXIV_NS = {'atom': _ATOM_URI}
+
+# Clark-notation tag, so iterparse filters entries by plain string compare
+_ENTRY_TAG = f'{{{_ATOM_URI}}}entry'
+
+# Field extractors compiled once; each evaluates in a single libxml2 call
+_TITLE_XP = etree.XPath('string(atom:title)', namespaces=_ARXIV_NS, smart_strings=False)
+_ID_XP = etree.XPath('string(atom:id)', namespaces=_ARXIV_NS, smart_strings=False)
+_AUTHORS_XP = etree.XPath('atom:author/atom:name/text()', namespaces=_ARXIV_NS, smart_strings=False)
+_SUMMARY_XP = etree.XPath('string(atom:summary)', namespaces=_ARXIV_NS, smart_strings=False)
+_PUBLISHED_XP = etree.XPath('string(atom:published)', namespaces=_ARXIV_NS, smart_strings=False)
+_PDF_LINK_XP = etree.XPath('string(atom:link[@title="pdf"]/@href)', namespaces=_ARXIV_NS, smart_strings=False)
+
 
 class PaperCrawler(BaseCrawler):
     """Paper crawler class for arXiv"""
 
+    arxiv_api_url = "http://export.arxiv.org/api/query"
+
     def __init__(self):
         """Initialize paper crawler"""
         super().__init__()
-        self.arxiv_api_url = "http://export.arxiv.org/api/query"
-        self.arxiv_namespace = {'atom': 'http://www.w3.org/2005/Atom'}
 
     def crawl(self, sources: List[dict], keywords: List[str], max_results: int = 20) -> List[Paper]:
         """
@@ -36,16 +52,12 @@ class PaperCrawler(BaseCrawler):
         """
         all_papers = []
 
-        for source in sources:
-            if not source.get('enabled', False):
-                logger.info(f"Skipping disabled source: {source['name']}")
-                continue
-
+        for source in self._enabled_sources(sources):
             logger.info(f"Crawling papers from: {source['name']}")
 
             try:
                 if source['name'] == 'arXiv':
-                    papers = self._crawl_arxiv(keywords, source.get('categories', []), max_results)
+                    papers = list(self._crawl_arxiv(keywords, source.get('categories', []), max_results))
                     all_papers.extend(papers)
                     logger.info(f"Crawled {len(papers)} papers from arXiv")
                 else:
@@ -56,7 +68,7 @@ class PaperCrawler(BaseCrawler):
 
         return all_papers
 
-    def _crawl_arxiv(self, keywords: List[str], categories: List[str], max_results: int) -> List[Paper]:
+    def _crawl_arxiv(self, keywords: List[str], categories: List[str], max_results: int) -> Iterator[Paper]:
         """
         Crawl papers from arXiv API
 
@@ -65,14 +77,15 @@ class PaperCrawler(BaseCrawler):
             categories: List of arXiv categories (e.g., cs.RO, cs.CV)
             max_results: Maximum results per keyword
 
-        Returns:
-            List of Paper objects
+        Yields:
+            Paper objects, in feed order and without duplicate arXiv IDs
         """
-        papers = []
+        seen_ids = set()
 
         # Build search query
-        # Combine keywords with OR operator
-        keyword_query = ' OR '.join([f'all:{quote(kw)}' for kw in keywords[:5]])  # Limit to 5 keywords
+        # Combine keywords with OR operator into a single request
+        query_keywords = keywords[:5]  # Limit to 5 keywords
+        keyword_query = ' OR '.join([f'all:{kw}' for kw in query_keywords])
 
         # Add category filter if specified
         if categories:
@@ -87,38 +100,56 @@ class PaperCrawler(BaseCrawler):
         params = {
             'search_query': search_query,
             'start': 0,
-            'max_results': max_results,
+            # One OR'd request stands in for one request per keyword
+            'max_results': max_results * max(len(query_keywords), 1),
             'sortBy': 'submittedDate',
             'sortOrder': 'descending'
         }
 
-        url = f"{self.arxiv_api_url}?{'&'.join([f'{k}={v}' for k, v in params.items()])}"
+        url = f"{self.arxiv_api_url}?{urlencode(params, quote_via=quote)}"
 
         logger.info(f"Fetching arXiv papers with query: {search_query}")
 
         response = self.fetch_url(url)
         if not response:
-            return papers
+            return
 
         try:
-            # Parse XML response
-            root = ET.fromstring(response.content)
-
-            # Find all entry elements
-            entries = root.findall('atom:entry', self.arxiv_namespace)
-
-            for entry in entries:
+            # Stream-parse entries from the XML response
+            for entry in self._iter_entries(response.content):
                 try:
                     paper = self._parse_arxiv_entry(entry)
-                    if paper:
-                        papers.append(paper)
+                    if paper and paper.arxiv_id not in seen_ids:
+                        seen_ids.add(paper.arxiv_id)
+                        yield paper
                 except Exception as e:
                     logger.error(f"Error parsing arXiv entry: {e}")
 
         except Exception as e:
             logger.error(f"Error parsing arXiv XML response: {e}")
 
-        return papers
+    def _iter_entries(self, content: bytes):
+        """
+        Stream Atom entries from an arXiv response
+
+        Each entry is cleared after the caller has processed it, so memory
+        stays constant regardless of the number of results.
+
+        Args:
+            content: Raw XML response body
+
+        Yields:
+            Entry elements
+        """
+        context = etree.iterparse(BytesIO(content), events=('end',), tag=_ENTRY_TAG)
+
+        for _, elem in context:
+            yield elem
+
+            # Free the processed entry and any already-parsed siblings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
 
     def _parse_arxiv_entry(self, entry) -> Optional[Paper]:
         """
@@ -132,33 +163,23 @@ class PaperCrawler(BaseCrawler):
         """
         try:
             # Extract title
-            title_elem = entry.find('atom:title', self.arxiv_namespace)
-            title = title_elem.text.strip().replace('\n', ' ') if title_elem is not None else ""
+            title = _TITLE_XP(entry).strip().replace('\n', ' ')
 
             # Extract arXiv ID from entry ID
-            id_elem = entry.find('atom:id', self.arxiv_namespace)
-            arxiv_url = id_elem.text if id_elem is not None else ""
+            arxiv_url = _ID_XP(entry)
             arxiv_id = arxiv_url.split('/abs/')[-1] if '/abs/' in arxiv_url else ""
 
             # Extract authors
-            author_elems = entry.findall('atom:author/atom:name', self.arxiv_namespace)
-            authors = ', '.join([author.text for author in author_elems])
+            authors = ', '.join(_AUTHORS_XP(entry))
 
             # Extract abstract
-            summary_elem = entry.find('atom:summary', self.arxiv_namespace)
-            abstract = summary_elem.text.strip().replace('\n', ' ') if summary_elem is not None else ""
+            abstract = _SUMMARY_XP(entry).strip().replace('\n', ' ')
 
             # Extract published date
-            published_elem = entry.find('atom:published', self.arxiv_namespace)
-            publish_date = published_elem.text[:10] if published_elem is not None else None
+            publish_date = _PUBLISHED_XP(entry)[:10] or None
 
             # Extract PDF link
-            pdf_link = ""
-            link_elems = entry.findall('atom:link', self.arxiv_namespace)
-            for link in link_elems:
-                if link.get('title') == 'pdf':
-                    pdf_link = link.get('href', '')
-                    break
+            pdf_link = _PDF_LINK_XP(entry)
 
             # If no PDF link found, construct it from arXiv ID
             if not pdf_link and arxiv_id:
@@ -209,7 +230,7 @@ class PaperCrawler(BaseCrawler):
             'sortOrder': 'descending'
         }
 
-        url = f"{self.arxiv_api_url}?{'&'.join([f'{k}={v}' for k, v in params.items()])}"
+        url = f"{self.arxiv_api_url}?{urlencode(params, quote_via=quote)}"
 
         logger.info(f"Fetching recent arXiv papers from categories: {categories}")
 
@@ -218,17 +239,13 @@ class PaperCrawler(BaseCrawler):
             return papers
 
         try:
-            root = ET.fromstring(response.content)
-            entries = root.findall('atom:entry', self.arxiv_namespace)
-
             cutoff_date = datetime.now() - timedelta(days=days)
 
-            for entry in entries:
+            for entry in self._iter_entries(response.content):
                 try:
                     # Check if paper is within date range
-                    published_elem = entry.find('atom:published', self.arxiv_namespace)
-                    if published_elem is not None:
-                        publish_date_str = published_elem.text[:10]
+                    publish_date_str = _PUBLISHED_XP(entry)[:10]
+                    if publish_date_str:
                         publish_date = datetime.strptime(publish_date_str, '%Y-%m-%d')
 
                         if publish_date < cutoff_date:
@@ -1,19 +1,159 @@
 """
 Patent crawler module
 """
+import asyncio
 import logging
-from typing import List, Optional
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
 from datetime import datetime
-from bs4 import BeautifulSoup
 import re
 
-from crawlers.base_crawler import BaseCrawler
+from lxml import etree
+from lxml import html as lxml_html
+
+from crawlers.base_crawler import AsyncCrawlerMixin, BaseCrawler, aiohttp
 from database.models import Patent
 
 logger = logging.getLogger(__name__)
 
+# Chinese patent numbers format: CN + digits + type letter
+# Example: CN201910123456.7
+_PATENT_NUMBER_RE = re.compile(
+    r'(?P<cn>CN\d{12,}[A-Z]?)'  # CN patent number
+    r'|[申请公开公告]号[：:]\s*(?P<prefixed>[A-Z]{2}\d+[A-Z]?)'  # With prefix
+    r'|\b(?P<num>\d{15,})\b'  # Just numbers
+)
+
+
+def _class_test(*classes: str) -> str:
+    """XPath predicate matching elements carrying any of the given CSS classes"""
+    return ' or '.join(f'contains(concat(" ", normalize-space(@class), " "), " {cls} ")' for cls in classes)
+
+
+# Baidu Scholar result fields, compiled once and evaluated in C by lxml
+_RESULT_XP = etree.XPath(f'//div[{_class_test("result", "c-result")}]')
+_TITLE_XP = etree.XPath(f'(.//*[(self::h3 or self::a) and ({_class_test("t", "title")})])[1]')
+_LINK_XP = etree.XPath('(.//a)[1]')
+_ABSTRACT_XP = etree.XPath(f'(.//*[(self::div or self::p) and ({_class_test("c-abstract", "abstract")})])[1]')
+_META_XP = etree.XPath(f'string((.//*[(self::div or self::p) and ({_class_test("meta", "c-row")})])[1])',
+                       smart_strings=False)
+_TEXT_XP = etree.XPath('string(.)', smart_strings=False)
+
+_APPLICANT_RE = re.compile(r'申请人[：:]\s*([^，,;；\n]+)')
+_DATE_RE = re.compile(r'(\d{4}[-年]\d{1,2}[-月]\d{1,2})')
+
+
+def _element_text(elem) -> str:
+    """Get an element's text with each text node stripped, like BeautifulSoup's get_text(strip=True)"""
+    return ''.join(text.strip() for text in elem.itertext())
+
+
+def _extract_patent_number(text: str) -> Optional[str]:
+    """
+    Extract patent number from text
+
+    Args:
+        text: Text containing patent number
+
+    Returns:
+        Patent number or None
+    """
+    match = _PATENT_NUMBER_RE.search(text)
+    if not match:
+        return None
+
+    return match.group('cn') or match.group('prefixed') or match.group('num')
+
+
+def _parse_result(result) -> Optional[dict]:
+    """
+    Parse Baidu Scholar patent result
+
+    Args:
+        result: lxml result element
+
+    Returns:
+        Patent field dict or None
+    """
+    # Extract title
+    title_elems = _TITLE_XP(result) or _LINK_XP(result)
+    if not title_elems:
+        return None
+
+    title = _element_text(title_elems[0])
+
+    # Extract abstract/description
+    abstract_elems = _ABSTRACT_XP(result)
+    abstract = _element_text(abstract_elems[0]) if abstract_elems else ""
+
+    # Try to extract patent number from text
+    text = _TEXT_XP(result)
+    application_no = _extract_patent_number(text)
+
+    if not application_no:
+        # Generate a unique identifier from title hash
+        application_no = f"TEMP_{abs(hash(title)) % 10000000000}"
+
+    # Extract applicant and date info
+    meta_text = _META_XP(result)
+    applicant = ""
+    application_date = None
+
+    if meta_text:
+        # Try to extract applicant
+        applicant_match = _APPLICANT_RE.search(meta_text)
+        if applicant_match:
+            applicant = applicant_match.group(1).strip()
+
+        # Try to extract date
+        date_match = _DATE_RE.search(meta_text)
+        if date_match:
+            application_date = date_match.group(1)
+
+    return {
+        'title': title,
+        'application_no': application_no,
+        'publication_no': "",
+        'application_date': application_date,
+        'publication_date': None,
+        'applicant': applicant,
+        'inventor': "",
+        'abstract': abstract,
+    }
+
+
+def _parse_page(html: bytes, limit: int) -> List[dict]:
+    """
+    Parse one search results page
+
+    Kept at module level and returning plain dicts so pages can be parsed in
+    worker processes (Patent objects are rebuilt by the caller).
+
+    Args:
+        html: Raw page body
+        limit: Maximum number of results to parse
+
+    Returns:
+        List of Patent field dicts
+    """
+    tree = lxml_html.fromstring(html)
+    patents = []
+
+    # Find patent results
+    # Baidu Scholar uses 'result' class for search results
+    for result in _RESULT_XP(tree)[:limit]:
+        try:
+            fields = _parse_result(result)
+            if fields:
+                patents.append(fields)
+        except Exception as e:
+            logger.error(f"Error parsing patent result: {e}")
+
+    return patents
 
-class PatentCrawler(BaseCrawler):
+
+class PatentCrawler(AsyncCrawlerMixin, BaseCrawler):
     """Patent crawler class"""
 
     def __init__(self):
@@ -28,16 +168,32 @@ class PatentCrawler(BaseCrawler):
             sources: List of patent source configurations
             keywords: List of keywords to search
 
+        Returns:
+            List of Patent objects
+        """
+        sources = self._enabled_sources(sources)
+        if not sources:
+            return []
+
+        if aiohttp is None:
+            return self._crawl_sync(sources, keywords)
+
+        return asyncio.run(self.crawl_async(sources, keywords))
+
+    def _crawl_sync(self, sources: List[dict], keywords: List[str]) -> List[Patent]:
+        """
+        Crawl sources one after another with blocking requests (used without aiohttp)
+
+        Args:
+            sources: List of enabled patent source configurations
+            keywords: List of keywords to search
+
         Returns:
             List of Patent objects
         """
         all_patents = []
 
         for source in sources:
-            if not source.get('enabled', False):
-                logger.info(f"Skipping disabled source: {source['name']}")
-                continue
-
             logger.info(f"Crawling patents from: {source['name']}")
 
             try:
@@ -54,6 +210,58 @@ class PatentCrawler(BaseCrawler):
 
         return all_patents
 
+    async def _crawl_with_session(self, session: 'aiohttp.ClientSession',
+                                  sources: List[dict], keywords: List[str]) -> List[Patent]:
+        """
+        Crawl all sources concurrently on one aiohttp session
+
+        Args:
+            session: aiohttp session
+            sources: List of enabled patent source configurations
+            keywords: List of keywords to search
+
+        Returns:
+            List of Patent objects
+        """
+        all_patents = []
+        tasks = []
+
+        for source in sources:
+            logger.info(f"Crawling patents from: {source['name']}")
+
+            if source.get('type') == 'api':
+                tasks.append(asyncio.to_thread(self._crawl_api_source, source, keywords))
+            else:
+                tasks.append(self._fetch_html_source_async(session, source, keywords))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # HTML sources return raw result pages, parsed together once all are in
+        pages = [
+            (source['name'], html)
+            for source, result in zip(sources, results)
+            if source.get('type') != 'api' and not isinstance(result, Exception)
+            for html in result
+        ]
+        parsed_pages = iter(await self._parse_pages_async(pages))
+
+        for source, result in zip(sources, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error crawling {source['name']}: {result}")
+                continue
+
+            if source.get('type') == 'api':
+                patents = result
+            else:
+                patents = []
+                for _ in result:
+                    patents.extend(next(parsed_pages))
+
+            all_patents.extend(patents)
+            logger.info(f"Crawled {len(patents)} patents from {source['name']}")
+
+        return all_patents
+
     def _crawl_api_source(self, source: dict, keywords: List[str]) -> List[Patent]:
         """
         Crawl patents from API source (e.g., CNIPA)
@@ -94,124 +302,85 @@ class PatentCrawler(BaseCrawler):
         patents = []
 
         # Search for each keyword (limit to avoid too many requests)
+        format_url = source['search_url'].format
         for keyword in keywords[:3]:
-            search_url = source['search_url'].format(keyword=keyword)
+            search_url = format_url(keyword=keyword)
             response = self.fetch_url(search_url)
 
-            if not response:
-                continue
+            if response:
+                patents.extend(self._parse_results_page(response.content, source['name'], 10))
 
-            try:
-                soup = BeautifulSoup(response.text, 'html.parser')
+        return patents
 
-                # Find patent results
-                # Baidu Scholar uses 'result' class for search results
-                results = soup.find_all('div', class_=['result', 'c-result'])
+    async def _fetch_html_source_async(self, session: 'aiohttp.ClientSession', source: dict,
+                                       keywords: List[str]) -> List[bytes]:
+        """
+        Fetch search result pages from HTML source, searching all keywords concurrently
 
-                for result in results[:10]:  # Limit to 10 per keyword
-                    try:
-                        patent = self._parse_baidu_patent(result)
-                        if patent:
-                            patents.append(patent)
-                    except Exception as e:
-                        logger.error(f"Error parsing patent result: {e}")
+        Args:
+            session: aiohttp session
+            source: Source configuration
+            keywords: Keywords to search
 
-            except Exception as e:
-                logger.error(f"Error processing patents from {source['name']}: {e}")
+        Returns:
+            Raw bodies of the pages that were fetched
+        """
+        # Search for each keyword (limit to avoid too many requests)
+        format_url = source['search_url'].format
+        search_urls = [format_url(keyword=keyword) for keyword in keywords[:3]]
+        pages = await asyncio.gather(*[self.fetch_url_async(session, url) for url in search_urls])
 
-        return patents
+        return [html for html in pages if html]
 
-    def _parse_baidu_patent(self, result) -> Optional[Patent]:
+    async def _parse_pages_async(self, pages: List[Tuple[str, bytes]]) -> List[List[Patent]]:
         """
-        Parse Baidu Scholar patent result
+        Parse fetched result pages, on worker processes when there are several
 
         Args:
-            result: BeautifulSoup result element
+            pages: (source name, raw page body) pairs
 
         Returns:
-            Patent object or None
+            Patents parsed from each page, in page order
         """
-        try:
-            # Extract title
-            title_elem = result.find(['h3', 'a'], class_=['t', 'title'])
-            if not title_elem:
-                title_elem = result.find('a')
-
-            if not title_elem:
-                return None
-
-            title = title_elem.get_text(strip=True)
-
-            # Extract abstract/description
-            abstract_elem = result.find(['div', 'p'], class_=['c-abstract', 'abstract'])
-            abstract = abstract_elem.get_text(strip=True) if abstract_elem else ""
-
-            # Try to extract patent number from text
-            text = result.get_text()
-            application_no = self._extract_patent_number(text)
-
-            if not application_no:
-                # Generate a unique identifier from title hash
-                application_no = f"TEMP_{abs(hash(title)) % 10000000000}"
-
-            # Extract applicant and date info
-            meta_elem = result.find(['div', 'p'], class_=['meta', 'c-row'])
-            applicant = ""
-            application_date = None
-
-            if meta_elem:
-                meta_text = meta_elem.get_text()
-
-                # Try to extract applicant
-                applicant_match = re.search(r'申请人[：:]\s*([^，,;；\n]+)', meta_text)
-                if applicant_match:
-                    applicant = applicant_match.group(1).strip()
-
-                # Try to extract date
-                date_match = re.search(r'(\d{4}[-年]\d{1,2}[-月]\d{1,2})', meta_text)
-                if date_match:
-                    application_date = date_match.group(1)
-
-            return Patent(
-                title=title,
-                application_no=application_no,
-                publication_no="",
-                application_date=application_date,
-                publication_date=None,
-                applicant=applicant,
-                inventor="",
-                abstract=abstract,
-                keywords=[]
-            )
+        # Starting worker processes costs more than parsing a single page
+        if len(pages) <= 1:
+            return [self._parse_results_page(html, source_name, 10) for source_name, html in pages]
+
+        # Parsing is CPU-bound, so pages are parsed in parallel on other cores
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=min(len(pages), os.cpu_count() or 1)) as executor:
+            parsed_pages = await asyncio.gather(*[
+                loop.run_in_executor(executor, _parse_page, html, 10)
+                for _, html in pages
+            ], return_exceptions=True)
+
+        results = []
+        for (source_name, _), page in zip(pages, parsed_pages):
+            if isinstance(page, Exception):
+                logger.error(f"Error processing patents from {source_name}: {page}")
+                results.append([])
+                continue
+            results.append([Patent(**fields) for fields in page])
 
-        except Exception as e:
-            logger.error(f"Error parsing Baidu patent: {e}")
-            return None
+        return results
 
-    def _extract_patent_number(self, text: str) -> Optional[str]:
+    def _parse_results_page(self, html: bytes, source_name: str, limit: int) -> List[Patent]:
         """
-        Extract patent number from text
+        Parse one search results page in this process
 
         Args:
-            text: Text containing patent number
+            html: Raw page body
+            source_name: Name of the source
+            limit: Maximum number of results to parse
 
         Returns:
-            Patent number or None
-        """
-        # Chinese patent numbers format: CN + digits + type letter
-        # Example: CN201910123456.7
-        patterns = [
-            r'CN\d{12,}[A-Z]?',  # CN patent number
-            r'[申请公开公告]号[：:]\s*([A-Z]{2}\d+[A-Z]?)',  # With prefix
-            r'\b\d{15,}\b'  # Just numbers
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(0) if 'CN' in match.group(0) else match.group(1) if len(match.groups()) > 0 else match.group(0)
-
-        return None
+            List of Patent objects
+        """
+        try:
+            return [Patent(**fields) for fields in _parse_page(html, limit)]
+        except Exception as e:
+            logger.error(f"Error processing patents from {source_name}: {e}")
+            return []
 
     def crawl_keywords(self, source: dict, keywords: List[str], max_per_keyword: int = 5) -> List[Patent]:
         """
@@ -226,26 +395,15 @@ class PatentCrawler(BaseCrawler):
             List of Patent objects
         """
         patents = []
+        format_url = source['search_url'].format
 
         for keyword in keywords:
             logger.info(f"Searching patents for keyword: {keyword}")
 
-            search_url = source['search_url'].format(keyword=keyword)
+            search_url = format_url(keyword=keyword)
             response = self.fetch_url(search_url)
 
-            if not response:
-                continue
-
-            try:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                results = soup.find_all('div', class_=['result', 'c-result'], limit=max_per_keyword)
-
-                for result in results:
-                    patent = self._parse_baidu_patent(result)
-                    if patent:
-                        patents.append(patent)
-
-            except Exception as e:
-                logger.error(f"Error crawling keyword '{keyword}': {e}")
+            if response:
+                patents.extend(self._parse_results_page(response.content, source['name'], max_per_keyword))
 
         return patents
@@ -3,15 +3,36 @@ Database manager for manufacturing info spider
 """
 import sqlite3
 import logging
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Iterable, Set
 from contextlib import contextmanager
+from dataclasses import fields
 
 from database.models import News, Patent, Paper
 
 logger = logging.getLogger(__name__)
 
 
+def _model_columns(model) -> Tuple[str, ...]:
+    """Get a model's table columns in to_row() order (id is autogenerated)"""
+    return tuple(field.name for field in fields(model) if field.name != 'id')
+
+
+def _insert_sql(table: str, columns: Tuple[str, ...]) -> str:
+    """Build an INSERT OR IGNORE statement for columns (duplicates are skipped)"""
+    return f'INSERT OR IGNORE INTO {table} ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})'
+
+
+# Insert statements built once at import instead of per row
+_NEWS_INSERT_SQL = _insert_sql('news', _model_columns(News))
+_PATENT_INSERT_SQL = _insert_sql('patents', _model_columns(Patent))
+_PAPER_INSERT_SQL = _insert_sql('papers', _model_columns(Paper))
+
+# Keys per IN (...) query; stays well under SQLite's bound-variable limit
+_EXISTS_CHUNK_SIZE = 500
+
+
 class DatabaseManager:
     """Database manager class"""
 
@@ -19,28 +40,82 @@ class DatabaseManager:
         """Initialize database manager"""
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection for the manager's lifetime keeps SQLite's page cache
+        # and prepared statements warm; the lock serializes access to it
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL (set once in _create_tables) only needs fsync at checkpoints
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._lock = threading.RLock()
+        # Nesting depth of transaction(); inside it statements aren't committed
+        self._transaction_depth = 0
+
         self._create_tables()
 
     @contextmanager
     def _get_connection(self):
         """Get database connection context manager"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            conn.close()
+        with self._lock:
+            if self._transaction_depth:
+                # The enclosing transaction() commits or rolls back
+                yield self._conn
+                return
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception as e:
+                self._conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run several operations in one write transaction
+
+        BEGIN IMMEDIATE takes the write lock up front, and everything inside
+        the block is committed together (one sync) or rolled back on error.
+        Nested calls join the outermost transaction.
+
+        Yields:
+            The shared database connection
+        """
+        with self._lock:
+            if self._transaction_depth:
+                self._transaction_depth += 1
+                try:
+                    yield self._conn
+                finally:
+                    self._transaction_depth -= 1
+                return
+
+            self._conn.execute('BEGIN IMMEDIATE')
+            self._transaction_depth = 1
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception as e:
+                self._conn.rollback()
+                logger.error(f"Database error: {e}")
+                raise
+            finally:
+                self._transaction_depth = 0
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
 
     def _create_tables(self):
         """Create database tables"""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
+            # Write-ahead logging lets readers run alongside a writer and
+            # avoids rewriting the rollback journal on every commit
+            cursor.execute('PRAGMA journal_mode=WAL')
+
             # Create news table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS news (
@@ -99,67 +174,88 @@ class DatabaseManager:
 
             # Create indexes
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_url ON news(url)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_is_sent ON news(is_sent)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_patents_application_no ON patents(application_no)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_patents_is_sent ON patents(is_sent)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_papers_arxiv_id ON papers(arxiv_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_papers_is_sent ON papers(is_sent)')
+
+            # Partial indexes holding only unsent rows, already in the
+            # ORDER BY created_at DESC order of the get_unsent_* queries
+            # (they replace the former plain is_sent indexes)
+            for table in ('news', 'patents', 'papers'):
+                cursor.execute(f'DROP INDEX IF EXISTS idx_{table}_is_sent')
+                cursor.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_{table}_unsent ON {table}(created_at DESC) WHERE is_sent = 0'
+                )
 
             logger.info("Database tables created successfully")
 
     def insert_news(self, news: News) -> Optional[int]:
-        """Insert news article"""
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                data = news.to_dict()
-                del data['id']
-
-                columns = ', '.join(data.keys())
-                placeholders = ', '.join(['?' for _ in data])
-                sql = f'INSERT INTO news ({columns}) VALUES ({placeholders})'
-
-                cursor.execute(sql, list(data.values()))
+        """Insert news article, returning its id or None if the URL already exists"""
+        with self._get_connection() as conn:
+            cursor = conn.execute(_NEWS_INSERT_SQL, news.to_row())
+            if cursor.rowcount:
                 return cursor.lastrowid
-        except sqlite3.IntegrityError:
-            logger.warning(f"News already exists: {news.url}")
-            return None
+
+        logger.warning(f"News already exists: {news.url}")
+        return None
 
     def insert_patent(self, patent: Patent) -> Optional[int]:
-        """Insert patent"""
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                data = patent.to_dict()
-                del data['id']
-
-                columns = ', '.join(data.keys())
-                placeholders = ', '.join(['?' for _ in data])
-                sql = f'INSERT INTO patents ({columns}) VALUES ({placeholders})'
-
-                cursor.execute(sql, list(data.values()))
+        """Insert patent, returning its id or None if the application number already exists"""
+        with self._get_connection() as conn:
+            cursor = conn.execute(_PATENT_INSERT_SQL, patent.to_row())
+            if cursor.rowcount:
                 return cursor.lastrowid
-        except sqlite3.IntegrityError:
-            logger.warning(f"Patent already exists: {patent.application_no}")
-            return None
+
+        logger.warning(f"Patent already exists: {patent.application_no}")
+        return None
 
     def insert_paper(self, paper: Paper) -> Optional[int]:
-        """Insert paper"""
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                data = paper.to_dict()
-                del data['id']
-
-                columns = ', '.join(data.keys())
-                placeholders = ', '.join(['?' for _ in data])
-                sql = f'INSERT INTO papers ({columns}) VALUES ({placeholders})'
-
-                cursor.execute(sql, list(data.values()))
+        """Insert paper, returning its id or None if the arXiv ID already exists"""
+        with self._get_connection() as conn:
+            cursor = conn.execute(_PAPER_INSERT_SQL, paper.to_row())
+            if cursor.rowcount:
                 return cursor.lastrowid
-        except sqlite3.IntegrityError:
-            logger.warning(f"Paper already exists: {paper.arxiv_id}")
-            return None
+
+        logger.warning(f"Paper already exists: {paper.arxiv_id}")
+        return None
+
+    def _insert_many(self, table: str, sql: str, items: list) -> int:
+        """
+        Insert model objects in a single transaction
+
+        Rows violating a UNIQUE constraint are skipped instead of aborting
+        the batch.
+
+        Args:
+            table: Table name (for logging)
+            sql: Insert statement matching the items' to_row()
+            items: News, Patent or Paper objects
+
+        Returns:
+            Number of rows inserted
+        """
+        if not items:
+            return 0
+
+        with self.transaction() as conn:
+            cursor = conn.executemany(sql, [item.to_row() for item in items])
+            inserted = cursor.rowcount
+
+        skipped = len(items) - inserted
+        if skipped:
+            logger.info(f"Skipped {skipped} existing rows in {table}")
+        return inserted
+
+    def insert_news_many(self, news_items: List[News]) -> int:
+        """Insert news articles in one transaction, returning the number inserted"""
+        return self._insert_many('news', _NEWS_INSERT_SQL, news_items)
+
+    def insert_patents_many(self, patents: List[Patent]) -> int:
+        """Insert patents in one transaction, returning the number inserted"""
+        return self._insert_many('patents', _PATENT_INSERT_SQL, patents)
+
+    def insert_papers_many(self, papers: List[Paper]) -> int:
+        """Insert papers in one transaction, returning the number inserted"""
+        return self._insert_many('papers', _PAPER_INSERT_SQL, papers)
 
     def get_unsent_news(self, limit: int = None) -> List[News]:
         """Get unsent news articles"""
@@ -197,33 +293,28 @@ class DatabaseManager:
     def mark_news_sent(self, news_ids: List[int], sent_date: str):
         """Mark news as sent"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            placeholders = ','.join(['?' for _ in news_ids])
-            cursor.execute(
-                f'UPDATE news SET is_sent = 1, sent_date = ? WHERE id IN ({placeholders})',
-                [sent_date] + news_ids
+            # One prepared statement reused per id; no bound-variable limit
+            conn.executemany(
+                'UPDATE news SET is_sent = 1, sent_date = ? WHERE id = ?',
+                [(sent_date, item_id) for item_id in news_ids]
             )
             logger.info(f"Marked {len(news_ids)} news as sent")
 
     def mark_patents_sent(self, patent_ids: List[int], sent_date: str):
         """Mark patents as sent"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            placeholders = ','.join(['?' for _ in patent_ids])
-            cursor.execute(
-                f'UPDATE patents SET is_sent = 1, sent_date = ? WHERE id IN ({placeholders})',
-                [sent_date] + patent_ids
+            conn.executemany(
+                'UPDATE patents SET is_sent = 1, sent_date = ? WHERE id = ?',
+                [(sent_date, item_id) for item_id in patent_ids]
             )
             logger.info(f"Marked {len(patent_ids)} patents as sent")
 
     def mark_papers_sent(self, paper_ids: List[int], sent_date: str):
         """Mark papers as sent"""
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            placeholders = ','.join(['?' for _ in paper_ids])
-            cursor.execute(
-                f'UPDATE papers SET is_sent = 1, sent_date = ? WHERE id IN ({placeholders})',
-                [sent_date] + paper_ids
+            conn.executemany(
+                'UPDATE papers SET is_sent = 1, sent_date = ? WHERE id = ?',
+                [(sent_date, item_id) for item_id in paper_ids]
             )
             logger.info(f"Marked {len(paper_ids)} papers as sent")
 
@@ -280,3 +371,56 @@ class DatabaseManager:
             cursor = conn.cursor()
             cursor.execute('SELECT 1 FROM papers WHERE arxiv_id = ?', (arxiv_id,))
             return cursor.fetchone() is not None
+
+    def count_rows(self, table: str) -> int:
+        """Get the number of rows in a table"""
+        with self._get_connection() as conn:
+            return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+    def get_keys(self, table: str, key_column: str) -> List[str]:
+        """
+        Get every non-empty value of a key column
+
+        Args:
+            table: Table name
+            key_column: Unique key column to read
+
+        Returns:
+            List of keys
+        """
+        with self._get_connection() as conn:
+            sql = f"SELECT {key_column} FROM {table} WHERE {key_column} IS NOT NULL AND {key_column} != ''"
+            return [row[0] for row in conn.execute(sql)]
+
+    def _existing_keys(self, table: str, key_column: str, keys: Iterable[str]) -> Set[str]:
+        """
+        Find which keys already exist in a table, querying in chunks
+
+        Args:
+            table: Table name
+            key_column: Unique key column to match
+            keys: Keys to look up
+
+        Returns:
+            Set of keys present in the table
+        """
+        keys = list(keys)
+        existing = set()
+        with self._get_connection() as conn:
+            for start in range(0, len(keys), _EXISTS_CHUNK_SIZE):
+                chunk = keys[start:start + _EXISTS_CHUNK_SIZE]
+                sql = f'SELECT {key_column} FROM {table} WHERE {key_column} IN ({",".join("?" * len(chunk))})'
+                existing.update(row[0] for row in conn.execute(sql, chunk))
+        return existing
+
+    def url_exists_many(self, urls: Iterable[str]) -> Set[str]:
+        """Get the subset of URLs that exist in news table"""
+        return self._existing_keys('news', 'url', urls)
+
+    def patent_exists_many(self, application_nos: Iterable[str]) -> Set[str]:
+        """Get the subset of application numbers that exist in patents table"""
+        return self._existing_keys('patents', 'application_no', application_nos)
+
+    def paper_exists_many(self, arxiv_ids: Iterable[str]) -> Set[str]:
+        """Get the subset of arXiv IDs that exist in papers table"""
+        return self._existing_keys('papers', 'arxiv_id', arxiv_ids)
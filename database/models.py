@@ -5,9 +5,36 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
 import json
+import sys
 
+try:
+    import orjson
+except ImportError:  # stdlib json is slower but equivalent here
+    orjson = None
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _keywords_json(keywords) -> str:
+    """Serialize a keywords list for storage (already-serialized strings pass through)"""
+    if isinstance(keywords, str):
+        return keywords
+    if orjson is not None:
+        return orjson.dumps(keywords).decode()
+    return json.dumps(keywords, ensure_ascii=False)
+
+
+def _parse_keywords(raw: str) -> List[str]:
+    """Deserialize stored keywords, skipping the JSON parser for empty lists"""
+    if not raw or raw == '[]':
+        return []
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class News:
     """News article model"""
     id: Optional[int] = None
@@ -39,22 +66,38 @@ class News:
             'publish_date': self.publish_date,
             'summary': self.summary,
             'content': self.content,
-            'keywords': json.dumps(self.keywords, ensure_ascii=False),
+            'keywords': _keywords_json(self.keywords),
             'score': self.score,
             'is_sent': self.is_sent,
             'sent_date': self.sent_date,
             'created_at': self.created_at
         }
 
+    def to_row(self) -> tuple:
+        """Convert to a table row: every column except id, in field order"""
+        return (
+            self.title,
+            self.url,
+            self.source,
+            self.publish_date,
+            self.summary,
+            self.content,
+            _keywords_json(self.keywords),
+            self.score,
+            self.is_sent,
+            self.sent_date,
+            self.created_at
+        )
+
     @classmethod
     def from_dict(cls, data: dict):
         """Create from dictionary"""
         if isinstance(data.get('keywords'), str):
-            data['keywords'] = json.loads(data['keywords'])
+            data['keywords'] = _parse_keywords(data['keywords'])
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Patent:
     """Patent model"""
     id: Optional[int] = None
@@ -89,21 +132,38 @@ class Patent:
             'applicant': self.applicant,
             'inventor': self.inventor,
             'abstract': self.abstract,
-            'keywords': json.dumps(self.keywords, ensure_ascii=False),
+            'keywords': _keywords_json(self.keywords),
             'is_sent': self.is_sent,
             'sent_date': self.sent_date,
             'created_at': self.created_at
         }
 
+    def to_row(self) -> tuple:
+        """Convert to a table row: every column except id, in field order"""
+        return (
+            self.title,
+            self.application_no,
+            self.publication_no,
+            self.application_date,
+            self.publication_date,
+            self.applicant,
+            self.inventor,
+            self.abstract,
+            _keywords_json(self.keywords),
+            self.is_sent,
+            self.sent_date,
+            self.created_at
+        )
+
     @classmethod
     def from_dict(cls, data: dict):
         """Create from dictionary"""
         if isinstance(data.get('keywords'), str):
-            data['keywords'] = json.loads(data['keywords'])
+            data['keywords'] = _parse_keywords(data['keywords'])
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Paper:
     """Academic paper model"""
     id: Optional[int] = None
@@ -138,15 +198,32 @@ class Paper:
             'pdf_url': self.pdf_url,
             'arxiv_id': self.arxiv_id,
             'publish_date': self.publish_date,
-            'keywords': json.dumps(self.keywords, ensure_ascii=False),
+            'keywords': _keywords_json(self.keywords),
             'is_sent': self.is_sent,
             'sent_date': self.sent_date,
             'created_at': self.created_at
         }
 
+    def to_row(self) -> tuple:
+        """Convert to a table row: every column except id, in field order"""
+        return (
+            self.title,
+            self.title_cn,
+            self.authors,
+            self.abstract,
+            self.abstract_cn,
+            self.pdf_url,
+            self.arxiv_id,
+            self.publish_date,
+            _keywords_json(self.keywords),
+            self.is_sent,
+            self.sent_date,
+            self.created_at
+        )
+
     @classmethod
     def from_dict(cls, data: dict):
         """Create from dictionary"""
         if isinstance(data.get('keywords'), str):
-            data['keywords'] = json.loads(data['keywords'])
+            data['keywords'] = _parse_keywords(data['keywords'])
         return cls(**data)
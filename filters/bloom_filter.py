@@ -0,0 +1,63 @@
+"""
+Bloom filter for fast in-process membership prescreening
+"""
+import math
+from hashlib import blake2b
+from typing import Iterable
+
+
+class BloomFilter:
+    """Bit-array Bloom filter using double hashing over one blake2b digest"""
+
+    def __init__(self, num_bits: int, num_hashes: int):
+        """
+        Initialize an empty Bloom filter
+
+        Args:
+            num_bits: Size of the bit array
+            num_hashes: Number of bit positions set per item
+        """
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(num_hashes, 1)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    @classmethod
+    def from_error_rate(cls, capacity: int, error_rate: float) -> 'BloomFilter':
+        """
+        Create a filter sized for capacity items at the given false positive rate
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate (0-1)
+
+        Returns:
+            BloomFilter instance
+        """
+        capacity = max(capacity, 1)
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        num_hashes = round(num_bits / capacity * math.log(2))
+        return cls(num_bits, num_hashes)
+
+    def _positions(self, key: str):
+        """Yield the bit positions for a key"""
+        digest = blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        """Add a key to the filter"""
+        bits = self._bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, keys: Iterable[str]):
+        """Add several keys to the filter"""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Return False if key was never added, True if it possibly was"""
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
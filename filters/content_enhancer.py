@@ -7,8 +7,16 @@ from typing import List, Tuple, Set
 import json
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:  # fall back to one substring scan per company
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Chinese company names: 2-10 Han characters followed by a common suffix
+_COMPANY_RE = re.compile(r'[\u4e00-\u9fa5]{2,10}(?:科技|智能|机器人|汽车|制造|集团|公司)')
+
 
 class ContentEnhancer:
     """Content enhancer for extracting companies and enriching information"""
@@ -17,6 +25,37 @@ class ContentEnhancer:
         """Initialize content enhancer with keywords configuration"""
         self.companies = keywords_config.get('companies', [])
 
+        # Names without letter case (e.g. Chinese) are matched on the text as
+        # is; only the cased ones need case-insensitive matching, so the text
+        # never has to be lowercased as a whole
+        self._caseless_companies = [c for c in self.companies if c.lower() == c.upper()]
+        self._cased_company_res = [
+            (c, re.compile(re.escape(c), re.IGNORECASE))
+            for c in self.companies if c.lower() != c.upper()
+        ]
+        self._company_automaton = self._build_company_automaton(self._caseless_companies)
+
+    @staticmethod
+    def _build_company_automaton(companies: List[str]):
+        """
+        Build an Aho-Corasick automaton over company names
+
+        Args:
+            companies: Company names to match verbatim
+
+        Returns:
+            Automaton with each name as its own payload, or None if
+            pyahocorasick is unavailable or the list is empty
+        """
+        if ahocorasick is None or not companies:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for company in companies:
+            automaton.add_word(company, company)
+        automaton.make_automaton()
+        return automaton
+
     def extract_companies(self, text: str) -> List[str]:
         """
         Extract company names from text
@@ -27,29 +66,26 @@ class ContentEnhancer:
         Returns:
             List of company names found
         """
-        companies_found = []
-        text_lower = text.lower()
+        companies_found = set()
 
-        # Check predefined company list
-        for company in self.companies:
-            if company.lower() in text_lower:
-                companies_found.append(company)
+        # Check predefined company list: caseless names in one pass over the text
+        if self._company_automaton is not None:
+            for _, company in self._company_automaton.iter(text):
+                companies_found.add(company)
+        else:
+            for company in self._caseless_companies:
+                if company in text:
+                    companies_found.add(company)
 
-        # Extract companies with common suffixes (Chinese)
-        company_pattern = r'[\u4e00-\u9fa5]{2,10}(科技|智能|机器人|汽车|制造|集团|公司)'
-        matches = re.findall(company_pattern, text)
+        for company, company_re in self._cased_company_res:
+            if company_re.search(text):
+                companies_found.add(company)
 
-        for match in matches:
-            # Reconstruct full company name
-            # Find the match in original text to preserve exact casing
-            match_pattern = re.escape(match)
-            full_matches = re.findall(r'[\u4e00-\u9fa5]{2,10}' + match_pattern, text)
-            if full_matches:
-                full_company = full_matches[0]
-                if full_company not in companies_found:
-                    companies_found.append(full_company)
+        # Extract companies with common suffixes (Chinese)
+        for match in _COMPANY_RE.finditer(text):
+            companies_found.add(match.group(0))
 
-        return list(set(companies_found))  # Remove duplicates
+        return list(companies_found)
 
     def generate_summary(self, title: str, content: str, max_length: int = 150) -> str:
         """
@@ -86,15 +122,7 @@ class ContentEnhancer:
 
         # Add companies to keywords if not already there
         if companies:
-            # Create a set of existing keywords
-            existing_keywords = set(news_item.keywords) if news_item.keywords else set()
-
-            # Add companies that aren't already in keywords
-            for company in companies:
-                if company not in existing_keywords:
-                    existing_keywords.add(company)
-
-            news_item.keywords = list(existing_keywords)
+            news_item.keywords = list(set(news_item.keywords or []).union(companies))
 
     def enrich_paper(self, paper_item) -> None:
         """
@@ -119,8 +147,4 @@ class ContentEnhancer:
             companies = self.extract_companies(patent_item.applicant)
 
             # Add to keywords
-            existing_keywords = set(patent_item.keywords) if patent_item.keywords else set()
-            for company in companies:
-                existing_keywords.add(company)
-
-            patent_item.keywords = list(existing_keywords)
+            patent_item.keywords = list(set(patent_item.keywords or []).union(companies))
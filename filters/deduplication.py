@@ -2,12 +2,59 @@
 Deduplication module for removing duplicate items
 """
 import logging
-from typing import List, Set
+from difflib import SequenceMatcher
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
 from database.models import News, Patent, Paper
 from database.db_manager import DatabaseManager
+from filters.bloom_filter import BloomFilter
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # fall back to difflib's pure-Python matcher
+    fuzz = process = None
 
 logger = logging.getLogger(__name__)
 
+# Bloom prescreen false positive rate; only "possibly present" keys reach SQL
+_BLOOM_ERROR_RATE = 1e-4
+# Room for keys added during the run before the error rate degrades
+_BLOOM_MIN_CAPACITY = 10000
+# Warm a Bloom filter only for tables at most this many times the size of a
+# lookup batch; reading every key of a bigger table costs more than the
+# batched existence queries it would save
+_BLOOM_MAX_TABLE_RATIO = 20
+# Items buffered by the streaming dedup before one existence lookup
+_STREAM_BATCH_SIZE = 500
+
+
+def _is_similar(title: str, kept_titles: List[str], threshold: float) -> bool:
+    """
+    Check whether a title is similar to any kept title
+
+    Args:
+        title: Normalized title
+        kept_titles: Normalized titles kept so far
+        threshold: Similarity threshold (0-1), as an Indel-distance ratio
+
+    Returns:
+        True if some kept title reaches the threshold
+    """
+    if process is not None:
+        return process.extractOne(title, kept_titles, scorer=fuzz.ratio,
+                                  score_cutoff=threshold * 100) is not None
+
+    # SequenceMatcher caches details of its second sequence, so fix the new
+    # title there and run the cheap upper bounds before the full ratio
+    matcher = SequenceMatcher(autojunk=False)
+    matcher.set_seq2(title)
+    for kept in kept_titles:
+        matcher.set_seq1(kept)
+        if (matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold
+                and matcher.ratio() >= threshold):
+            return True
+    return False
+
 
 class Deduplicator:
     """Deduplicator class for removing duplicates"""
@@ -20,39 +67,164 @@ class Deduplicator:
             db_manager: Database manager instance
         """
         self.db_manager = db_manager
+        # Per-table Bloom filters of stored keys, decided on first use; None
+        # if the table is too big for warming one to pay off
+        self._blooms: Dict[str, Optional[BloomFilter]] = {}
 
-    def deduplicate_news(self, news_list: List[News]) -> List[News]:
+    def _get_bloom(self, table: str, key_column: str, batch_size: int) -> Optional[BloomFilter]:
         """
-        Remove duplicate news articles based on URL
+        Get the Bloom filter of keys stored in a table, building it on first use
 
         Args:
-            news_list: List of News objects
+            table: Table name
+            key_column: Unique key column
+            batch_size: Number of keys in the first lookup
 
         Returns:
-            List of deduplicated News objects
+            BloomFilter holding every stored key, or None if the table is
+            much larger than the lookups
+        """
+        if table not in self._blooms:
+            count = self.db_manager.count_rows(table)
+            if count > max(batch_size, 1) * _BLOOM_MAX_TABLE_RATIO:
+                self._blooms[table] = None
+                logger.debug("Skipping Bloom filter for %d %s rows", count, table)
+            else:
+                bloom = BloomFilter.from_error_rate(max(count * 2, _BLOOM_MIN_CAPACITY), _BLOOM_ERROR_RATE)
+                bloom.update(self.db_manager.get_keys(table, key_column))
+                self._blooms[table] = bloom
+                logger.debug("Loaded %d %s keys into Bloom filter", count, table)
+        return self._blooms[table]
+
+    def _find_existing(self, table: str, key_column: str, keys: Iterable[str],
+                       exists_many: Callable[[Iterable[str]], Set[str]]) -> Set[str]:
+        """
+        Find stored keys, sending only Bloom filter hits (if any) to the database
+
+        Args:
+            table: Table name
+            key_column: Unique key column
+            keys: Candidate keys
+            exists_many: Batched database existence check
+
+        Returns:
+            Set of keys already stored
+        """
+        keys = list(keys)
+        bloom = self._get_bloom(table, key_column, len(keys))
+        if bloom is None:
+            return exists_many(keys) if keys else set()
+
+        maybe = [key for key in keys if key in bloom]
+        return exists_many(maybe) if maybe else set()
+
+    def _drop_existing(self, candidates: dict, table: str, key_column: str,
+                       exists_many: Callable[[Iterable[str]], Set[str]]) -> list:
+        """
+        Drop candidates already stored and remember the rest as seen
+
+        Args:
+            candidates: Dictionary of key -> item, unique within the run
+            table: Table name
+            key_column: Unique key column
+            exists_many: Batched database existence check
+
+        Returns:
+            List of new items in input order
         """
-        unique_news = []
-        seen_urls = set()
+        existing = self._find_existing(table, key_column, candidates, exists_many)
+        if existing:
+            logger.debug("Skipping %d %s already in database", len(existing), table)
+
+        new_items = [item for key, item in candidates.items() if key not in existing]
+        # Keys about to be stored, so later batches in this run see them
+        bloom = self._blooms[table]
+        if bloom is not None:
+            bloom.update(key for key in candidates if key not in existing)
+        return new_items
+
+    def _iter_deduplicate(self, items: Iterable, key_attr: str, table: str,
+                          exists_many: Callable[[Iterable[str]], Set[str]], label: str,
+                          batch_size: int, skip_missing_key: bool = False) -> Iterator:
+        """
+        Lazily remove items whose key was seen earlier or is already stored
+
+        Items are buffered in batches so each batch needs one existence lookup.
 
-        for news in news_list:
-            # Check if URL already seen in current list
-            if news.url in seen_urls:
-                logger.debug(f"Skipping duplicate URL in list: {news.url}")
+        Args:
+            items: Iterable of News, Patent or Paper objects
+            key_attr: Attribute holding the unique key (also the table column)
+            table: Table name
+            exists_many: Batched database existence check
+            label: Plural item name for logging
+            batch_size: Number of items checked against the database at once
+            skip_missing_key: Drop items with an empty key instead of keeping one
+
+        Yields:
+            Deduplicated items in input order
+        """
+        get_key = attrgetter(key_attr)
+        seen_keys = set()
+        candidates = {}
+        total = kept = 0
+
+        for item in items:
+            total += 1
+            key = get_key(item)
+            if skip_missing_key and not key:
+                logger.warning("Skipping %s without %s: %.50s...", label, key_attr, item.title)
                 continue
 
-            # Check if URL exists in database
-            if self.db_manager.url_exists(news.url):
-                logger.debug(f"Skipping existing URL in database: {news.url}")
+            # Keep the first occurrence of each key
+            if key in seen_keys:
+                logger.debug("Skipping duplicate %s in list: %s", key_attr, key)
                 continue
+            seen_keys.add(key)
+            candidates[key] = item
+
+            if len(candidates) >= batch_size:
+                new_items = self._drop_existing(candidates, table, key_attr, exists_many)
+                kept += len(new_items)
+                yield from new_items
+                candidates = {}
+
+        if candidates:
+            new_items = self._drop_existing(candidates, table, key_attr, exists_many)
+            kept += len(new_items)
+            yield from new_items
+
+        if total > kept:
+            logger.info(f"Removed {total - kept} duplicate {label}")
+
+    def iter_deduplicate_news(self, news_items: Iterable[News],
+                              batch_size: int = _STREAM_BATCH_SIZE) -> Iterator[News]:
+        """Lazily remove duplicate news articles based on URL"""
+        return self._iter_deduplicate(news_items, 'url', 'news', self.db_manager.url_exists_many,
+                                      'news articles', batch_size)
+
+    def iter_deduplicate_patents(self, patents: Iterable[Patent],
+                                 batch_size: int = _STREAM_BATCH_SIZE) -> Iterator[Patent]:
+        """Lazily remove duplicate patents based on application number"""
+        return self._iter_deduplicate(patents, 'application_no', 'patents', self.db_manager.patent_exists_many,
+                                      'patents', batch_size)
+
+    def iter_deduplicate_papers(self, papers: Iterable[Paper],
+                                batch_size: int = _STREAM_BATCH_SIZE) -> Iterator[Paper]:
+        """Lazily remove duplicate papers based on arXiv ID, dropping papers without one"""
+        return self._iter_deduplicate(papers, 'arxiv_id', 'papers', self.db_manager.paper_exists_many,
+                                      'papers', batch_size, skip_missing_key=True)
 
-            seen_urls.add(news.url)
-            unique_news.append(news)
+    def deduplicate_news(self, news_list: List[News]) -> List[News]:
+        """
+        Remove duplicate news articles based on URL
 
-        removed_count = len(news_list) - len(unique_news)
-        if removed_count > 0:
-            logger.info(f"Removed {removed_count} duplicate news articles")
+        Args:
+            news_list: List of News objects
 
-        return unique_news
+        Returns:
+            List of deduplicated News objects
+        """
+        return list(self.iter_deduplicate_news(news_list))
 
     def deduplicate_patents(self, patent_list: List[Patent]) -> List[Patent]:
         """
@@ -64,28 +236,7 @@ class Deduplicator:
         Returns:
             List of deduplicated Patent objects
         """
-        unique_patents = []
-        seen_application_nos = set()
-
-        for patent in patent_list:
-            # Check if application number already seen in current list
-            if patent.application_no in seen_application_nos:
-                logger.debug(f"Skipping duplicate application number in list: {patent.application_no}")
-                continue
-
-            # Check if application number exists in database
-            if self.db_manager.patent_exists(patent.application_no):
-                logger.debug(f"Skipping existing patent in database: {patent.application_no}")
-                continue
-
-            seen_application_nos.add(patent.application_no)
-            unique_patents.append(patent)
-
-        removed_count = len(patent_list) - len(unique_patents)
-        if removed_count > 0:
-            logger.info(f"Removed {removed_count} duplicate patents")
-
-        return unique_patents
+        return list(self.iter_deduplicate_patents(patent_list))
 
     def deduplicate_papers(self, paper_list: List[Paper]) -> List[Paper]:
         """
@@ -97,33 +248,7 @@ class Deduplicator:
         Returns:
             List of deduplicated Paper objects
         """
-        unique_papers = []
-        seen_arxiv_ids = set()
-
-        for paper in paper_list:
-            # Skip if no arXiv ID
-            if not paper.arxiv_id:
-                logger.warning(f"Paper without arXiv ID: {paper.title[:50]}...")
-                continue
-
-            # Check if arXiv ID already seen in current list
-            if paper.arxiv_id in seen_arxiv_ids:
-                logger.debug(f"Skipping duplicate arXiv ID in list: {paper.arxiv_id}")
-                continue
-
-            # Check if arXiv ID exists in database
-            if self.db_manager.paper_exists(paper.arxiv_id):
-                logger.debug(f"Skipping existing paper in database: {paper.arxiv_id}")
-                continue
-
-            seen_arxiv_ids.add(paper.arxiv_id)
-            unique_papers.append(paper)
-
-        removed_count = len(paper_list) - len(unique_papers)
-        if removed_count > 0:
-            logger.info(f"Removed {removed_count} duplicate papers")
-
-        return unique_papers
+        return list(self.iter_deduplicate_papers(paper_list))
 
     def deduplicate_by_title(self, items: List[any], threshold: float = 0.9) -> List[any]:
         """
@@ -136,21 +261,24 @@ class Deduplicator:
         Returns:
             List of deduplicated items
         """
-        # This is a simple implementation using exact title matching
-        # For fuzzy matching, consider using libraries like difflib or fuzzywuzzy
-
+        # Each item is compared with the titles kept so far, so the first of
+        # a group of similar titles wins
         unique_items = []
         seen_titles = set()
+        kept_titles = []
 
         for item in items:
             # Normalize title (lowercase, strip whitespace)
             normalized_title = item.title.lower().strip()
 
-            if normalized_title not in seen_titles:
-                seen_titles.add(normalized_title)
-                unique_items.append(item)
-            else:
-                logger.debug(f"Skipping duplicate title: {item.title[:50]}...")
+            # Exact repeats are caught by the set before any fuzzy comparison
+            if normalized_title in seen_titles or _is_similar(normalized_title, kept_titles, threshold):
+                logger.debug("Skipping duplicate title: %.50s...", item.title)
+                continue
+
+            seen_titles.add(normalized_title)
+            kept_titles.append(normalized_title)
+            unique_items.append(item)
 
         removed_count = len(items) - len(unique_items)
         if removed_count > 0:
@@ -158,6 +286,12 @@ class Deduplicator:
 
         return unique_items
 
+    @staticmethod
+    def _count_existing(keys: List[str], exists_many: Callable[[Iterable[str]], Set[str]]) -> int:
+        """Count the keys already stored, repeats included, with one batched lookup"""
+        existing = exists_many(set(keys))
+        return sum(key in existing for key in keys)
+
     def get_duplicate_stats(self, news_urls: List[str] = None,
                           patent_nos: List[str] = None,
                           arxiv_ids: List[str] = None) -> dict:
@@ -179,18 +313,12 @@ class Deduplicator:
         }
 
         if news_urls:
-            for url in news_urls:
-                if self.db_manager.url_exists(url):
-                    stats['news_duplicates'] += 1
+            stats['news_duplicates'] = self._count_existing(news_urls, self.db_manager.url_exists_many)
 
         if patent_nos:
-            for patent_no in patent_nos:
-                if self.db_manager.patent_exists(patent_no):
-                    stats['patent_duplicates'] += 1
+            stats['patent_duplicates'] = self._count_existing(patent_nos, self.db_manager.patent_exists_many)
 
         if arxiv_ids:
-            for arxiv_id in arxiv_ids:
-                if self.db_manager.paper_exists(arxiv_id):
-                    stats['paper_duplicates'] += 1
+            stats['paper_duplicates'] = self._count_existing(arxiv_ids, self.db_manager.paper_exists_many)
 
         return stats
@@ -1,10 +1,18 @@
 """
 Keyword filter module for content filtering
 """
+import heapq
 import logging
-from typing import List, Tuple, Dict, Any
+import re
+from collections import Counter
+from typing import List, Tuple, Dict, Any, Callable, Iterable, Iterator, Optional, Set
 from database.models import News, Patent, Paper
 
+try:
+    import ahocorasick
+except ImportError:  # fall back to an alternation regex
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +32,71 @@ class KeywordFilter:
         self.paper_keywords = keywords_config.get('papers', [])
         self.settings = keywords_config.get('settings', {})
 
+        # One matcher per corpus scans each text once regardless of how
+        # many keywords there are
+        self._news_matcher = self._build_matcher(self.news_keywords)
+        self._patent_matcher = self._build_matcher(self.patent_keywords)
+        self._paper_matcher = self._build_matcher(self.paper_keywords)
+        # Per-category news matchers, built on first use by filter_by_category
+        self._category_matchers: Dict[str, Optional[Callable[[str], Set[int]]]] = {}
+
+    @staticmethod
+    def _build_matcher(keywords: List[str]) -> Optional[Callable[[str], Set[int]]]:
+        """
+        Build a single-pass, case-insensitive keyword matcher
+
+        Uses an Aho-Corasick automaton when pyahocorasick is installed,
+        otherwise one compiled alternation regex.
+
+        Args:
+            keywords: List of keywords
+
+        Returns:
+            Function mapping a text to the indices of the keywords it
+            contains, or None if there are no keywords
+        """
+        indices_by_keyword = {}
+        for idx, keyword in enumerate(keywords):
+            kw_lower = keyword.lower()
+            if kw_lower:
+                indices_by_keyword.setdefault(kw_lower, []).append(idx)
+
+        if not indices_by_keyword:
+            return None
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for kw_lower, indices in indices_by_keyword.items():
+                automaton.add_word(kw_lower, tuple(indices))
+            automaton.make_automaton()
+
+            def match_automaton(text: str) -> Set[int]:
+                hit_indices = set()
+                for _, indices in automaton.iter(text.lower()):
+                    hit_indices.update(indices)
+                return hit_indices
+
+            return match_automaton
+
+        # The regex reports only the longest keyword starting at each
+        # position, so each keyword also carries the indices of every
+        # keyword it contains
+        implied = {
+            kw_lower: [idx for other, indices in indices_by_keyword.items()
+                       if other in kw_lower for idx in indices]
+            for kw_lower in indices_by_keyword
+        }
+        alternation = '|'.join(re.escape(kw) for kw in sorted(indices_by_keyword, key=len, reverse=True))
+        pattern = re.compile(f'(?=({alternation}))', re.IGNORECASE)
+
+        def match_pattern(text: str) -> Set[int]:
+            hit_indices = set()
+            for hit in set(pattern.findall(text)):
+                hit_indices.update(implied[hit.lower()])
+            return hit_indices
+
+        return match_pattern
+
     def _flatten_keywords(self, keyword_dict: Dict[str, List[str]]) -> List[str]:
         """
         Flatten nested keyword dictionary to a single list
@@ -39,6 +112,38 @@ class KeywordFilter:
             keywords.extend(kws)
         return keywords
 
+    def iter_filter_news(self, news_items: Iterable[News], threshold: int = None) -> Iterator[News]:
+        """
+        Lazily filter news articles by keywords
+
+        Args:
+            news_items: Iterable of News objects
+            threshold: Minimum keyword matches required (default from config)
+
+        Yields:
+            Filtered News objects with scores and matched keywords
+        """
+        if threshold is None:
+            threshold = self.settings.get('news_threshold', 1)
+
+        total = kept = 0
+
+        for news in news_items:
+            total += 1
+            # Match title and summary separately, without building a combined copy
+            matched, score, matched_keywords = self._match_keywords(
+                (news.title, news.summary), self.news_keywords, self._news_matcher
+            )
+
+            if matched and score >= threshold:
+                news.score = score
+                news.keywords = matched_keywords
+                logger.debug("News matched: %.50s... (score: %d)", news.title, score)
+                kept += 1
+                yield news
+
+        logger.info(f"Filtered {kept} news from {total} total")
+
     def filter_news(self, news_list: List[News], threshold: int = None) -> List[News]:
         """
         Filter news articles by keywords
@@ -50,26 +155,38 @@ class KeywordFilter:
         Returns:
             List of filtered News objects with scores and matched keywords
         """
-        if threshold is None:
-            threshold = self.settings.get('news_threshold', 1)
+        return list(self.iter_filter_news(news_list, threshold))
 
-        filtered_news = []
+    def iter_filter_patents(self, patents: Iterable[Patent], threshold: int = None) -> Iterator[Patent]:
+        """
+        Lazily filter patents by keywords
 
-        for news in news_list:
-            # Combine title and summary for matching
-            content = f"{news.title} {news.summary}".lower()
+        Args:
+            patents: Iterable of Patent objects
+            threshold: Minimum keyword matches required
 
-            # Match keywords
-            matched, score, matched_keywords = self._match_keywords(content, self.news_keywords)
+        Yields:
+            Filtered Patent objects with matched keywords
+        """
+        if threshold is None:
+            threshold = self.settings.get('patent_threshold', 1)
+
+        total = kept = 0
+
+        for patent in patents:
+            total += 1
+            # Match title and abstract separately, without building a combined copy
+            matched, score, matched_keywords = self._match_keywords(
+                (patent.title, patent.abstract), self.patent_keywords, self._patent_matcher
+            )
 
             if matched and score >= threshold:
-                news.score = score
-                news.keywords = matched_keywords
-                filtered_news.append(news)
-                logger.debug(f"News matched: {news.title[:50]}... (score: {score})")
+                patent.keywords = matched_keywords
+                logger.debug("Patent matched: %.50s... (score: %d)", patent.title, score)
+                kept += 1
+                yield patent
 
-        logger.info(f"Filtered {len(filtered_news)} news from {len(news_list)} total")
-        return filtered_news
+        logger.info(f"Filtered {kept} patents from {total} total")
 
     def filter_patents(self, patent_list: List[Patent], threshold: int = None) -> List[Patent]:
         """
@@ -82,25 +199,38 @@ class KeywordFilter:
         Returns:
             List of filtered Patent objects with matched keywords
         """
-        if threshold is None:
-            threshold = self.settings.get('patent_threshold', 1)
+        return list(self.iter_filter_patents(patent_list, threshold))
+
+    def iter_filter_papers(self, papers: Iterable[Paper], threshold: int = None) -> Iterator[Paper]:
+        """
+        Lazily filter papers by keywords
+
+        Args:
+            papers: Iterable of Paper objects
+            threshold: Minimum keyword matches required
 
-        filtered_patents = []
+        Yields:
+            Filtered Paper objects with matched keywords
+        """
+        if threshold is None:
+            threshold = self.settings.get('paper_threshold', 1)
 
-        for patent in patent_list:
-            # Combine title and abstract for matching
-            content = f"{patent.title} {patent.abstract}".lower()
+        total = kept = 0
 
-            # Match keywords
-            matched, score, matched_keywords = self._match_keywords(content, self.patent_keywords)
+        for paper in papers:
+            total += 1
+            # Match title and abstract separately, without building a combined copy
+            matched, score, matched_keywords = self._match_keywords(
+                (paper.title, paper.abstract), self.paper_keywords, self._paper_matcher
+            )
 
             if matched and score >= threshold:
-                patent.keywords = matched_keywords
-                filtered_patents.append(patent)
-                logger.debug(f"Patent matched: {patent.title[:50]}... (score: {score})")
+                paper.keywords = matched_keywords
+                logger.debug("Paper matched: %.50s... (score: %d)", paper.title, score)
+                kept += 1
+                yield paper
 
-        logger.info(f"Filtered {len(filtered_patents)} patents from {len(patent_list)} total")
-        return filtered_patents
+        logger.info(f"Filtered {kept} papers from {total} total")
 
     def filter_papers(self, paper_list: List[Paper], threshold: int = None) -> List[Paper]:
         """
@@ -113,51 +243,36 @@ class KeywordFilter:
         Returns:
             List of filtered Paper objects with matched keywords
         """
-        if threshold is None:
-            threshold = self.settings.get('paper_threshold', 1)
-
-        filtered_papers = []
-
-        for paper in paper_list:
-            # Combine title and abstract for matching
-            content = f"{paper.title} {paper.abstract}".lower()
+        return list(self.iter_filter_papers(paper_list, threshold))
 
-            # Match keywords
-            matched, score, matched_keywords = self._match_keywords(content, self.paper_keywords)
-
-            if matched and score >= threshold:
-                paper.keywords = matched_keywords
-                filtered_papers.append(paper)
-                logger.debug(f"Paper matched: {paper.title[:50]}... (score: {score})")
-
-        logger.info(f"Filtered {len(filtered_papers)} papers from {len(paper_list)} total")
-        return filtered_papers
-
-    def _match_keywords(self, content: str, keywords: List[str]) -> Tuple[bool, int, List[str]]:
+    def _match_keywords(self, texts: Tuple[str, ...], keywords: List[str],
+                        matcher: Optional[Callable[[str], Set[int]]]) -> Tuple[bool, int, List[str]]:
         """
-        Match keywords in content
+        Match keywords in texts (case-insensitive)
 
         Args:
-            content: Text content to search (should be lowercase)
+            texts: Texts to search, each matched on its own
             keywords: List of keywords to match
+            matcher: Matcher built from keywords by _build_matcher
 
         Returns:
             Tuple of (matched: bool, score: int, matched_keywords: List[str])
         """
-        score = 0
-        matched_keywords = []
-
-        for keyword in keywords:
-            # Convert keyword to lowercase for case-insensitive matching
-            kw_lower = keyword.lower()
+        if matcher is None:
+            return False, 0, []
 
-            if kw_lower in content:
-                score += 1
-                matched_keywords.append(keyword)
+        hit_indices = set()
+        for text in texts:
+            if text:
+                hit_indices |= matcher(text)
 
-        matched = score > 0
+        # Most items match nothing; skip building the result for them
+        if not hit_indices:
+            return False, 0, []
 
-        return matched, score, matched_keywords
+        # Report in keyword list order
+        matched_keywords = [keywords[idx] for idx in sorted(hit_indices)]
+        return True, len(matched_keywords), matched_keywords
 
     def filter_by_category(self, news_list: List[News], category: str) -> List[News]:
         """
@@ -176,11 +291,15 @@ class KeywordFilter:
             logger.warning(f"Category '{category}' not found in keywords config")
             return []
 
+        if category not in self._category_matchers:
+            self._category_matchers[category] = self._build_matcher(category_keywords)
+        category_matcher = self._category_matchers[category]
         filtered_news = []
 
         for news in news_list:
-            content = f"{news.title} {news.summary}".lower()
-            matched, score, matched_keywords = self._match_keywords(content, category_keywords)
+            matched, score, matched_keywords = self._match_keywords(
+                (news.title, news.summary), category_keywords, category_matcher
+            )
 
             if matched:
                 news.score = score
@@ -201,9 +320,8 @@ class KeywordFilter:
         Returns:
             List of top scored News objects
         """
-        # Sort by score (descending) and then by created_at (newest first)
-        sorted_news = sorted(news_list, key=lambda x: (x.score, x.created_at), reverse=True)
-        return sorted_news[:top_n]
+        # Highest score first, then newest; a top_n heap instead of a full sort
+        return heapq.nlargest(top_n, news_list, key=lambda x: (x.score, x.created_at))
 
     def get_keyword_statistics(self, items: List[Any]) -> Dict[str, int]:
         """
@@ -215,14 +333,10 @@ class KeywordFilter:
         Returns:
             Dictionary of keyword -> count
         """
-        keyword_counts = {}
+        keyword_counts = Counter()
 
         for item in items:
-            if hasattr(item, 'keywords') and item.keywords:
-                for keyword in item.keywords:
-                    keyword_counts[keyword] = keyword_counts.get(keyword, 0) + 1
+            keyword_counts.update(getattr(item, 'keywords', None) or ())
 
         # Sort by count (descending)
-        sorted_keywords = dict(sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True))
-
-        return sorted_keywords
+        return dict(keyword_counts.most_common())
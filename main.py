@@ -6,6 +6,8 @@ import argparse
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -29,7 +31,6 @@ from crawlers.paper_crawler import PaperCrawler
 from filters.keyword_filter import KeywordFilter
 from filters.deduplication import Deduplicator
 from notifiers.feishu_bot import FeishuBot
-from web.generator import WebsiteGenerator
 from scheduler.task_scheduler import TaskScheduler
 
 # Setup logging
@@ -43,9 +44,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+KEYWORDS_CONFIG = PROJECT_ROOT / 'config' / 'keywords.json'
+SOURCES_CONFIG = PROJECT_ROOT / 'config' / 'sources.json'
+
+
+def _config_mtime(config_file: Path):
+    """Get a config file's modification time (None if it can't be read)"""
+    try:
+        return config_file.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 def load_config(config_file: Path):
-    """Load configuration from JSON file"""
+    """Load configuration from JSON file (re-parsed only when it changes; don't mutate the result)"""
+    return _load_config(config_file, _config_mtime(config_file))
+
+
+@lru_cache(maxsize=16)
+def _load_config(config_file: Path, mtime):
+    """Parse a JSON config file, cached per (path, mtime)"""
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
             return json.load(f)
@@ -54,7 +72,19 @@ def load_config(config_file: Path):
         return {}
 
 
+def get_keyword_filter() -> KeywordFilter:
+    """Get the keyword filter for the current keywords.json, so its matchers are built once"""
+    return _build_keyword_filter(KEYWORDS_CONFIG, _config_mtime(KEYWORDS_CONFIG))
+
+
+@lru_cache(maxsize=1)
+def _build_keyword_filter(config_file: Path, mtime) -> KeywordFilter:
+    """Build a keyword filter, cached per (path, mtime) of its config"""
+    return KeywordFilter(_load_config(config_file, mtime))
+
+
 def crawl_news(db_manager: DatabaseManager, feishu_bot: FeishuBot,
+               keyword_filter: KeywordFilter, sources_config: dict,
                dry_run: bool = False, test: bool = False):
     """
     Crawl and process news
@@ -62,49 +92,33 @@ def crawl_news(db_manager: DatabaseManager, feishu_bot: FeishuBot,
     Args:
         db_manager: Database manager
         feishu_bot: Feishu bot instance
+        keyword_filter: Keyword filter built from keywords.json
+        sources_config: Parsed sources.json
         dry_run: If True, don't save to database or send to Feishu
         test: If True, only crawl a small sample
     """
     logger.info("=== Starting News Crawling ===")
 
-    # Load configurations
-    keywords_config = load_config(PROJECT_ROOT / 'config' / 'keywords.json')
-    sources_config = load_config(PROJECT_ROOT / 'config' / 'sources.json')
-
     # Initialize modules
     crawler = NewsCrawler()
-    keyword_filter = KeywordFilter(keywords_config)
     deduplicator = Deduplicator(db_manager)
 
     try:
         # Get news sources
         news_sources = sources_config.get('news_sources', [])
 
-        # Flatten all keywords for crawling
-        all_keywords = []
-        for category, kws in keywords_config.get('news', {}).items():
-            all_keywords.extend(kws)
-
-        # Crawl news
+        # Crawl news (the filter already holds the flattened news keywords)
         logger.info(f"Crawling news from {len(news_sources)} sources...")
-        news_items = crawler.crawl(news_sources, all_keywords[:10])  # Limit keywords
+        news_items = crawler.crawl(news_sources, keyword_filter.news_keywords[:10])  # Limit keywords
         logger.info(f"Crawled {len(news_items)} news items")
 
         if not news_items:
             logger.warning("No news items crawled")
             return
 
-        # Filter by keywords
-        filtered_news = keyword_filter.filter_news(news_items)
-        logger.info(f"Filtered to {len(filtered_news)} news items")
-
-        if not filtered_news:
-            logger.warning("No news items passed keyword filter")
-            return
-
-        # Deduplicate
-        unique_news = deduplicator.deduplicate_news(filtered_news)
-        logger.info(f"After deduplication: {len(unique_news)} news items")
+        # Filter and deduplicate in one streaming pass; only new items are kept
+        unique_news = list(deduplicator.iter_deduplicate_news(keyword_filter.iter_filter_news(news_items)))
+        logger.info(f"After filtering and deduplication: {len(unique_news)} news items")
 
         if not unique_news:
             logger.info("No new news items to add")
@@ -117,11 +131,7 @@ def crawl_news(db_manager: DatabaseManager, feishu_bot: FeishuBot,
             return
 
         # Save to database
-        saved_count = 0
-        for news in unique_news:
-            news_id = db_manager.insert_news(news)
-            if news_id:
-                saved_count += 1
+        saved_count = db_manager.insert_news_many(unique_news)
 
         logger.info(f"Saved {saved_count} new news items to database")
 
@@ -153,6 +163,7 @@ def crawl_news(db_manager: DatabaseManager, feishu_bot: FeishuBot,
 
 
 def crawl_papers_and_patents(db_manager: DatabaseManager, feishu_bot: FeishuBot,
+                             keyword_filter: KeywordFilter, sources_config: dict,
                              dry_run: bool = False, test: bool = False):
     """
     Crawl and process papers and patents
@@ -160,63 +171,52 @@ def crawl_papers_and_patents(db_manager: DatabaseManager, feishu_bot: FeishuBot,
     Args:
         db_manager: Database manager
         feishu_bot: Feishu bot instance
+        keyword_filter: Keyword filter built from keywords.json
+        sources_config: Parsed sources.json
         dry_run: If True, don't save to database or send to Feishu
         test: If True, only crawl a small sample
     """
     logger.info("=== Starting Papers & Patents Crawling ===")
 
-    # Load configurations
-    keywords_config = load_config(PROJECT_ROOT / 'config' / 'keywords.json')
-    sources_config = load_config(PROJECT_ROOT / 'config' / 'sources.json')
-
     # Initialize modules
     paper_crawler = PaperCrawler()
     patent_crawler = PatentCrawler()
-    keyword_filter = KeywordFilter(keywords_config)
     deduplicator = Deduplicator(db_manager)
 
     try:
         # Crawl papers
         paper_sources = sources_config.get('paper_sources', [])
-        paper_keywords = keywords_config.get('papers', [])
-
         logger.info(f"Crawling papers from {len(paper_sources)} sources...")
-        papers = paper_crawler.crawl(paper_sources, paper_keywords, max_results=30)
+        papers = paper_crawler.crawl(paper_sources, keyword_filter.paper_keywords, max_results=30)
         logger.info(f"Crawled {len(papers)} papers")
 
-        # Filter and deduplicate papers
-        if papers:
-            filtered_papers = keyword_filter.filter_papers(papers)
-            unique_papers = deduplicator.deduplicate_papers(filtered_papers)
-            logger.info(f"After filtering and deduplication: {len(unique_papers)} papers")
-
-            if not dry_run:
-                for paper in unique_papers:
-                    db_manager.insert_paper(paper)
-                logger.info(f"Saved {len(unique_papers)} papers to database")
-        else:
-            unique_papers = []
-
         # Crawl patents
         patent_sources = sources_config.get('patent_sources', [])
-        patent_keywords = keywords_config.get('patents', [])
-
         logger.info(f"Crawling patents from {len(patent_sources)} sources...")
-        patents = patent_crawler.crawl(patent_sources, patent_keywords)
+        patents = patent_crawler.crawl(patent_sources, keyword_filter.patent_keywords)
         logger.info(f"Crawled {len(patents)} patents")
 
-        # Filter and deduplicate patents
-        if patents:
-            filtered_patents = keyword_filter.filter_patents(patents)
-            unique_patents = deduplicator.deduplicate_patents(filtered_patents)
-            logger.info(f"After filtering and deduplication: {len(unique_patents)} patents")
-
-            if not dry_run:
-                for patent in unique_patents:
-                    db_manager.insert_patent(patent)
-                logger.info(f"Saved {len(unique_patents)} patents to database")
-        else:
-            unique_patents = []
+        # The filter passes are independent, so run them side by side. Only
+        # these run in the pool: the patent crawl starts a parse process
+        # pool, which must not be forked from a multi-threaded process
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            papers_future = executor.submit(keyword_filter.filter_papers, papers)
+            patents_future = executor.submit(keyword_filter.filter_patents, patents)
+            filtered_papers = papers_future.result()
+            filtered_patents = patents_future.result()
+
+        unique_papers = deduplicator.deduplicate_papers(filtered_papers)
+        logger.info(f"After filtering and deduplication: {len(unique_papers)} papers")
+        unique_patents = deduplicator.deduplicate_patents(filtered_patents)
+        logger.info(f"After filtering and deduplication: {len(unique_patents)} patents")
+
+        if not dry_run:
+            if unique_papers:
+                saved_count = db_manager.insert_papers_many(unique_papers)
+                logger.info(f"Saved {saved_count} papers to database")
+            if unique_patents:
+                saved_count = db_manager.insert_patents_many(unique_patents)
+                logger.info(f"Saved {saved_count} patents to database")
 
         if dry_run:
             logger.info("DRY RUN: Would send papers and patents")
@@ -263,6 +263,9 @@ def update_website(db_manager: DatabaseManager):
     logger.info("=== Updating Website ===")
 
     try:
+        # Imported here so crawl-only runs don't load Jinja2
+        from web.generator import WebsiteGenerator
+
         generator = WebsiteGenerator(db_manager)
         generator.generate_all()
         generator.generate_readme()
@@ -311,15 +314,24 @@ def main():
         return
 
     # Execute tasks based on type
+    if args.type in ('news', 'papers_patents', 'all'):
+        # Loaded once and shared by both crawl tasks
+        keyword_filter = get_keyword_filter()
+        sources_config = load_config(SOURCES_CONFIG)
+
     if args.type == 'news' or args.type == 'all':
-        crawl_news(db_manager, feishu_bot, dry_run=args.dry_run, test=args.test)
+        crawl_news(db_manager, feishu_bot, keyword_filter, sources_config,
+                   dry_run=args.dry_run, test=args.test)
 
     if args.type == 'papers_patents' or args.type == 'all':
-        crawl_papers_and_patents(db_manager, feishu_bot, dry_run=args.dry_run, test=args.test)
+        crawl_papers_and_patents(db_manager, feishu_bot, keyword_filter, sources_config,
+                                 dry_run=args.dry_run, test=args.test)
 
     if args.type == 'update_web' or args.type == 'all':
         update_website(db_manager)
 
+    feishu_bot.close()
+    db_manager.close()
     logger.info("=== Task Completed ===")
 
 
@@ -1,20 +1,219 @@
 """
 Feishu bot notifier module
 """
+import atexit
 import json
 import logging
+import re
 import hmac
 import hashlib
-import base64
+import binascii
+import queue
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # stdlib json is slower but equivalent here
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # HTTP/2 is opt-in via FEISHU_USE_HTTP2
+    httpx = None
 
 from database.models import News, Patent, Paper
-from config.settings import FEISHU_WEBHOOK_URL, FEISHU_SECRET
+from config.settings import (
+    FEISHU_WEBHOOK_URL,
+    FEISHU_SECRET,
+    FEISHU_BATCH_SIZE,
+    FEISHU_BATCH_INTERVAL,
+    FEISHU_USE_HTTP2
+)
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {'Content-Type': 'application/json; charset=utf-8'}
+# Messages waiting for the background sender before new ones are dropped
+_BACKGROUND_QUEUE_SIZE = 256
+
+# Webhook retries, limited to responses that mean the message was not
+# processed (rate limited / unavailable) so no card is posted twice
+_SEND_RETRIES = 3
+_SEND_RETRY_STATUS_CODES = [429, 503]
+
+# Simple heuristic: keywords containing a company suffix are likely companies
+_COMPANY_SUFFIX_RE = re.compile('公司|科技|汽车|集团|机器人|智能')
+
+
+def _create_session():
+    """
+    Create a keep-alive session for webhook posts
+
+    Returns:
+        httpx.Client speaking HTTP/2 when FEISHU_USE_HTTP2 is set and
+        httpx[http2] is installed, otherwise a requests.Session that retries
+        failed posts
+    """
+    if FEISHU_USE_HTTP2 and httpx is not None:
+        try:
+            # Transport-level retries only cover connection failures
+            transport = httpx.HTTPTransport(http2=True, retries=_SEND_RETRIES)
+            return httpx.Client(transport=transport, timeout=10)
+        except ImportError as e:
+            logger.warning(f"HTTP/2 unavailable, falling back to requests: {e}")
+
+    session = requests.Session()
+
+    # POST is not retried by default; the webhook only accepts posts. Read
+    # errors aren't retried since the server may already have taken the
+    # message. The final error response is returned rather than raised so it
+    # gets logged as usual
+    retry_strategy = Retry(
+        total=_SEND_RETRIES,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=_SEND_RETRY_STATUS_CODES,
+        allowed_methods=["POST"],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=2, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    if len(text) > limit:
+        return text[:limit] + '...'
+    return text
+
+
+def _is_company_keyword(keyword: str) -> bool:
+    """Guess whether a matched keyword names a company rather than a technology"""
+    if _COMPANY_SUFFIX_RE.search(keyword):
+        return True
+    # Also check if it starts with capital letter (for English companies)
+    return len(keyword) > 1 and keyword[0].isupper() and ' ' not in keyword
+
+
+def _dumps_payload(message: Dict[str, Any]) -> bytes:
+    """Serialize a message to UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(message)
+    return json.dumps(message, ensure_ascii=False).encode('utf-8')
+
+
+# Divider between card items; shared since it's never modified
+_HR_ELEMENT = {"tag": "hr"}
+
+
+def _markdown_elements(contents: Iterable[str]) -> List[Dict[str, Any]]:
+    """Wrap contents in markdown card elements with a divider between items"""
+    elements = []
+    for content in contents:
+        if elements:
+            elements.append(_HR_ELEMENT)
+        elements.append({"tag": "markdown", "content": content})
+    return elements
+
+
+def _render_news(news: News) -> str:
+    """Render one news article as card markdown"""
+    # Separate keywords into technical and companies
+    tech_keywords = []
+    companies = []
+
+    if news.keywords:
+        for kw in news.keywords:
+            if _is_company_keyword(kw):
+                companies.append(kw)
+            else:
+                tech_keywords.append(kw)
+
+    # Build content from parts joined once
+    parts = [f"**📄 {news.title}**\n\n"]
+
+    # Source and date
+    parts.append(f"**来源**: {news.source}")
+    if news.publish_date:
+        parts.append(f" | **发布**: {news.publish_date}")
+    parts.append("\n\n")
+
+    # Technical keywords
+    if tech_keywords:
+        tech_str = " ".join([f"#{kw}" for kw in tech_keywords])
+        parts.append(f"**技术关键词**: {tech_str}\n")
+
+    # Companies
+    if companies:
+        company_str = " ".join([f"🏢{c}" for c in companies])
+        parts.append(f"**相关企业**: {company_str}\n")
+
+    # Summary
+    if news.summary:
+        parts.append("\n**内容简介**:\n")
+        parts.append(f"{_truncate(news.summary, 180)}\n")
+
+    # Link
+    parts.append(f"\n[🔗 查看详情]({news.url})")
+
+    return "".join(parts)
+
+
+def _render_paper(paper: Paper) -> str:
+    """Render one paper as card markdown"""
+    parts = [f"**{paper.title}**\n\n"]
+
+    # Authors
+    parts.append(f"**作者**: {_truncate(paper.authors, 100)}\n")
+
+    # Link
+    if paper.pdf_url:
+        parts.append(f"**链接**: [📄 PDF]({paper.pdf_url})\n")
+
+    # Keywords
+    if paper.keywords:
+        keywords_str = " ".join([f"#{kw}" for kw in paper.keywords[:6]])  # Limit keywords
+        parts.append(f"**关键词**: {keywords_str}\n")
+
+    # Abstract
+    if paper.abstract:
+        parts.append("\n**摘要**:\n")
+        parts.append(_truncate(paper.abstract, 200))
+
+    return "".join(parts)
+
+
+def _render_patent(patent: Patent) -> str:
+    """Render one patent as card markdown"""
+    parts = [f"**{patent.title}**\n\n"]
+
+    # Applicant
+    if patent.applicant:
+        parts.append(f"**权利人**: {patent.applicant}\n")
+
+    # Application number and link
+    parts.append(f"**申请号**: {patent.application_no}\n")
+
+    # Keywords
+    if patent.keywords:
+        keywords_str = " ".join([f"#{kw}" for kw in patent.keywords[:6]])
+        parts.append(f"**关键词**: {keywords_str}\n")
+
+    # Abstract
+    if patent.abstract:
+        parts.append("\n**摘要**:\n")
+        parts.append(_truncate(patent.abstract, 200))
+
+    return "".join(parts)
+
 
 class FeishuBot:
     """Feishu bot class for sending messages"""
@@ -29,6 +228,22 @@ class FeishuBot:
         """
         self.webhook_url = webhook_url or FEISHU_WEBHOOK_URL
         self.secret = secret or FEISHU_SECRET
+        self._secret_bytes = self.secret.encode('utf-8') if self.secret else b''
+        # (timestamp, signature) of the last signing; timestamps have 1 s
+        # resolution, so messages sent within the same second reuse it
+        self._last_signature = (None, '')
+        # Keep-alive session so consecutive messages skip TCP/TLS setup
+        self._session = _create_session()
+        # News queued by send_news, sent together by flush() or by a timer
+        # once the oldest has waited FEISHU_BATCH_INTERVAL seconds
+        self._pending: List[News] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        # Queued news must not be lost if close() is never reached
+        atexit.register(self.flush)
+        # Background sender for fire-and-forget messages, started on first use
+        self._background_queue: Optional[queue.Queue] = None
+        self._background_lock = threading.Lock()
 
         if not self.webhook_url:
             logger.warning("Feishu webhook URL not configured")
@@ -46,18 +261,20 @@ class FeishuBot:
         if not self.secret:
             return ""
 
-        # Construct string to sign
-        string_to_sign = f"{timestamp}\n{self.secret}"
+        last_timestamp, last_signature = self._last_signature
+        if timestamp == last_timestamp:
+            return last_signature
+
+        # Feishu signs "timestamp\nsecret" as the HMAC key over an empty message
+        string_to_sign = b'%d\n' % timestamp + self._secret_bytes
 
         # Generate HMAC-SHA256 signature
-        hmac_code = hmac.new(
-            string_to_sign.encode("utf-8"),
-            digestmod=hashlib.sha256
-        ).digest()
+        hmac_code = hmac.new(string_to_sign, digestmod=hashlib.sha256).digest()
 
-        # Base64 encode
-        signature = base64.b64encode(hmac_code).decode('utf-8')
+        # Base64 encode (b2a_base64 is what b64encode wraps)
+        signature = binascii.b2a_base64(hmac_code, newline=False).decode('ascii')
 
+        self._last_signature = (timestamp, signature)
         return signature
 
     def send_message(self, message: Dict[str, Any]) -> bool:
@@ -67,6 +284,56 @@ class FeishuBot:
         Args:
             message: Message payload
 
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._post_message(message, self._session)
+
+    def send_message_nowait(self, message: Dict[str, Any]) -> bool:
+        """
+        Queue a message for a background thread to send
+
+        For notifications whose outcome the caller doesn't act on: the caller
+        doesn't wait on the network, and failures are only logged.
+
+        Args:
+            message: Message payload
+
+        Returns:
+            True if queued, False if the queue is full
+        """
+        with self._background_lock:
+            if self._background_queue is None:
+                self._background_queue = queue.Queue(maxsize=_BACKGROUND_QUEUE_SIZE)
+                threading.Thread(target=self._background_sender, name='feishu-sender', daemon=True).start()
+                # Let queued messages go out before the interpreter exits
+                atexit.register(self._background_queue.join)
+
+        try:
+            self._background_queue.put_nowait(message)
+            return True
+        except queue.Full:
+            logger.error("Feishu send queue is full, dropping message")
+            return False
+
+    def _background_sender(self):
+        """Send queued messages one by one on a session of its own"""
+        session = _create_session()
+        while True:
+            message = self._background_queue.get()
+            try:
+                self._post_message(message, session)
+            finally:
+                self._background_queue.task_done()
+
+    def _post_message(self, message: Dict[str, Any], session) -> bool:
+        """
+        Sign and post a message
+
+        Args:
+            message: Message payload
+            session: HTTP session to post with (see _create_session)
+
         Returns:
             True if successful, False otherwise
         """
@@ -82,11 +349,14 @@ class FeishuBot:
                 message['timestamp'] = str(timestamp)
                 message['sign'] = signature
 
-            response = requests.post(
+            # Serialized straight to bytes, without an intermediate str;
+            # httpx takes a raw body as content=, requests as data=
+            body_arg = 'content' if httpx is not None and isinstance(session, httpx.Client) else 'data'
+            response = session.post(
                 self.webhook_url,
-                json=message,
-                headers={'Content-Type': 'application/json'},
-                timeout=10
+                headers=_JSON_HEADERS,
+                timeout=10,
+                **{body_arg: _dumps_payload(message)}
             )
 
             response.raise_for_status()
@@ -105,20 +375,76 @@ class FeishuBot:
 
     def send_news(self, news: News) -> bool:
         """
-        Send single news article to Feishu
+        Queue a news article for Feishu
+
+        Queued articles go out as one card, sent right away once
+        FEISHU_BATCH_SIZE are waiting, or handed to the background sender
+        once the oldest has waited FEISHU_BATCH_INTERVAL seconds. flush() and
+        close() send the rest, as does interpreter exit.
 
         Args:
             news: News object
 
         Returns:
-            True if successful
+            True if queued (not yet sent), or if the batch it completed was
+            sent successfully
         """
-        card = self._create_news_card([news])
-        message = {
-            "msg_type": "interactive",
-            "card": card
-        }
-        return self.send_message(message)
+        with self._pending_lock:
+            self._pending.append(news)
+            if len(self._pending) < FEISHU_BATCH_SIZE:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(FEISHU_BATCH_INTERVAL, self._flush_in_background)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return True
+
+        return self.flush()
+
+    def _take_pending(self) -> List[News]:
+        """Take all queued news articles, cancelling the pending flush timer"""
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending, self._pending = self._pending, []
+        return pending
+
+    def _flush_in_background(self):
+        """Timer callback: queue the waiting articles for the background sender"""
+        pending = self._take_pending()
+        if pending:
+            self.send_message_nowait({
+                "msg_type": "interactive",
+                "card": self._create_news_card(pending)
+            })
+
+    def flush(self) -> bool:
+        """
+        Send queued news articles as one card
+
+        Returns:
+            True if nothing was queued or the send succeeded
+        """
+        pending = self._take_pending()
+        if not pending:
+            return True
+
+        return self.send_news_batch(pending)
+
+    def close(self):
+        """Send any queued news and background messages, then close the HTTP session"""
+        self.flush()
+        if self._background_queue is not None:
+            self._background_queue.join()
+        self._session.close()
+
+    def __enter__(self):
+        """Context manager enter"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
 
     def send_news_batch(self, news_list: List[News]) -> bool:
         """
@@ -173,64 +499,7 @@ class FeishuBot:
         Returns:
             Card JSON
         """
-        elements = []
-
-        for i, news in enumerate(news_list):
-            # Separate keywords into technical and companies
-            tech_keywords = []
-            companies = []
-
-            if news.keywords:
-                # Simple heuristic: if keyword contains company suffixes, it's likely a company
-                company_suffixes = ['公司', '科技', '汽车', '集团', '机器人', '智能']
-                for kw in news.keywords:
-                    is_company = any(suffix in kw for suffix in company_suffixes)
-                    # Also check if it starts with capital letter (for English companies)
-                    is_company = is_company or (len(kw) > 1 and kw[0].isupper() and ' ' not in kw)
-
-                    if is_company:
-                        companies.append(kw)
-                    else:
-                        tech_keywords.append(kw)
-
-            # Build content
-            content = f"**📄 {news.title}**\n\n"
-
-            # Source and date
-            content += f"**来源**: {news.source}"
-            if news.publish_date:
-                content += f" | **发布**: {news.publish_date}"
-            content += "\n\n"
-
-            # Technical keywords
-            if tech_keywords:
-                tech_str = " ".join([f"#{kw}" for kw in tech_keywords])
-                content += f"**技术关键词**: {tech_str}\n"
-
-            # Companies
-            if companies:
-                company_str = " ".join([f"🏢{c}" for c in companies])
-                content += f"**相关企业**: {company_str}\n"
-
-            # Summary
-            if news.summary:
-                content += f"\n**内容简介**:\n"
-                summary = news.summary[:180] if len(news.summary) > 180 else news.summary
-                content += f"{summary}{'...' if len(news.summary) > 180 else ''}\n"
-
-            # Link
-            content += f"\n[🔗 查看详情]({news.url})"
-
-            elements.append({
-                "tag": "markdown",
-                "content": content
-            })
-
-            # Add divider between items (except for last item)
-            if i < len(news_list) - 1:
-                elements.append({
-                    "tag": "hr"
-                })
+        elements = _markdown_elements(map(_render_news, news_list))
 
         card = {
             "header": {
@@ -265,35 +534,7 @@ class FeishuBot:
                 "content": f"### 📚 学术论文 ({len(papers)}篇)"
             })
 
-            for i, paper in enumerate(papers):
-                # Build content
-                content = f"**{paper.title}**\n\n"
-
-                # Authors
-                content += f"**作者**: {paper.authors[:100]}{'...' if len(paper.authors) > 100 else ''}\n"
-
-                # Link
-                if paper.pdf_url:
-                    content += f"**链接**: [📄 PDF]({paper.pdf_url})\n"
-
-                # Keywords
-                if paper.keywords:
-                    keywords_str = " ".join([f"#{kw}" for kw in paper.keywords[:6]])  # Limit keywords
-                    content += f"**关键词**: {keywords_str}\n"
-
-                # Abstract
-                if paper.abstract:
-                    content += f"\n**摘要**:\n"
-                    abstract = paper.abstract[:200] if len(paper.abstract) > 200 else paper.abstract
-                    content += f"{abstract}{'...' if len(paper.abstract) > 200 else ''}"
-
-                elements.append({
-                    "tag": "markdown",
-                    "content": content
-                })
-
-                if i < len(papers) - 1:
-                    elements.append({"tag": "hr"})
+            elements.extend(_markdown_elements(map(_render_paper, papers)))
 
         # Add divider between sections
         if papers and patents:
@@ -312,35 +553,7 @@ class FeishuBot:
                 "content": f"### 🔬 专利信息 ({len(patents)}项)"
             })
 
-            for i, patent in enumerate(patents):
-                # Build content
-                content = f"**{patent.title}**\n\n"
-
-                # Applicant
-                if patent.applicant:
-                    content += f"**权利人**: {patent.applicant}\n"
-
-                # Application number and link
-                content += f"**申请号**: {patent.application_no}\n"
-
-                # Keywords
-                if patent.keywords:
-                    keywords_str = " ".join([f"#{kw}" for kw in patent.keywords[:6]])
-                    content += f"**关键词**: {keywords_str}\n"
-
-                # Abstract
-                if patent.abstract:
-                    content += f"\n**摘要**:\n"
-                    abstract = patent.abstract[:200] if len(patent.abstract) > 200 else patent.abstract
-                    content += f"{abstract}{'...' if len(patent.abstract) > 200 else ''}"
-
-                elements.append({
-                    "tag": "markdown",
-                    "content": content
-                })
-
-                if i < len(patents) - 1:
-                    elements.append({"tag": "hr"})
+            elements.extend(_markdown_elements(map(_render_patent, patents)))
 
         card = {
             "header": {
@@ -382,7 +595,7 @@ class FeishuBot:
             context: Additional context information
 
         Returns:
-            True if successful
+            True if queued for sending
         """
         text = f"⚠️ 爬虫系统错误通知\n\n"
         text += f"错误信息: {error_message}\n"
@@ -390,4 +603,10 @@ class FeishuBot:
             text += f"上下文: {context}\n"
         text += f"时间: {time.strftime('%Y-%m-%d %H:%M:%S')}"
 
-        return self.send_text(text)
+        # Error reports shouldn't hold up the task that hit the error
+        return self.send_message_nowait({
+            "msg_type": "text",
+            "content": {
+                "text": text
+            }
+        })
@@ -5,10 +5,73 @@ Actual scheduling should be done via Windows Task Scheduler.
 """
 import logging
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Day codes used in schedules -> Task Scheduler DaysOfWeek elements
+_DAY_XML = {
+    'MON': '<Monday />',
+    'TUE': '<Tuesday />',
+    'WED': '<Wednesday />',
+    'THU': '<Thursday />',
+    'FRI': '<Friday />',
+    'SAT': '<Saturday />',
+    'SUN': '<Sunday />'
+}
+
+# Weekday bitmasks (bit n = datetime.weekday() n, Monday is 0)
+_NEWS_CRAWL_DAYS = (1 << 0) | (1 << 2) | (1 << 4)  # MON, WED, FRI
+_PAPERS_PATENTS_CRAWL_DAYS = 1 << 4  # FRI
+
+# Task definition filled in by generate_task_xml
+_TASK_XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-16"?>
+<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
+  <RegistrationInfo>
+    <Description>{task_name} - Manufacturing Info Spider</Description>
+  </RegistrationInfo>
+  <Triggers>
+    <CalendarTrigger>
+      <StartBoundary>2024-01-01T{time}:00</StartBoundary>
+      <Enabled>true</Enabled>
+      <ScheduleByWeek>
+        <DaysOfWeek>
+          {days_xml}
+        </DaysOfWeek>
+        <WeeksInterval>1</WeeksInterval>
+      </ScheduleByWeek>
+    </CalendarTrigger>
+  </Triggers>
+  <Principals>
+    <Principal>
+      <LogonType>InteractiveToken</LogonType>
+      <RunLevel>LeastPrivilege</RunLevel>
+    </Principal>
+  </Principals>
+  <Settings>
+    <MultipleInstancesPolicy>IgnoreNew</MultipleInstancesPolicy>
+    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
+    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
+    <AllowHardTerminate>true</AllowHardTerminate>
+    <StartWhenAvailable>true</StartWhenAvailable>
+    <RunOnlyIfNetworkAvailable>true</RunOnlyIfNetworkAvailable>
+  </Settings>
+  <Actions>
+    <Exec>
+      <Command>{program}</Command>
+      <Arguments>{arguments}</Arguments>
+    </Exec>
+  </Actions>
+</Task>
+"""
+
+
+@lru_cache(maxsize=None)
+def _days_xml(days: Tuple[str, ...]) -> str:
+    """Build the DaysOfWeek elements for a tuple of day codes"""
+    return ''.join([_DAY_XML[day] for day in days])
+
 
 class TaskScheduler:
     """Task scheduler helper class"""
@@ -47,60 +110,14 @@ class TaskScheduler:
         Returns:
             XML string
         """
-        # Days mapping
-        days_map = {
-            'MON': 'Monday',
-            'TUE': 'Tuesday',
-            'WED': 'Wednesday',
-            'THU': 'Thursday',
-            'FRI': 'Friday',
-            'SAT': 'Saturday',
-            'SUN': 'Sunday'
-        }
-
-        days_xml = ''.join([f'<{days_map[day]} />' for day in schedule.get('days', [])])
-        time = schedule.get('time', '10:00')
-
-        xml = f"""<?xml version="1.0" encoding="UTF-16"?>
-<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
-  <RegistrationInfo>
-    <Description>{task_name} - Manufacturing Info Spider</Description>
-  </RegistrationInfo>
-  <Triggers>
-    <CalendarTrigger>
-      <StartBoundary>2024-01-01T{time}:00</StartBoundary>
-      <Enabled>true</Enabled>
-      <ScheduleByWeek>
-        <DaysOfWeek>
-          {days_xml}
-        </DaysOfWeek>
-        <WeeksInterval>1</WeeksInterval>
-      </ScheduleByWeek>
-    </CalendarTrigger>
-  </Triggers>
-  <Principals>
-    <Principal>
-      <LogonType>InteractiveToken</LogonType>
-      <RunLevel>LeastPrivilege</RunLevel>
-    </Principal>
-  </Principals>
-  <Settings>
-    <MultipleInstancesPolicy>IgnoreNew</MultipleInstancesPolicy>
-    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
-    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
-    <AllowHardTerminate>true</AllowHardTerminate>
-    <StartWhenAvailable>true</StartWhenAvailable>
-    <RunOnlyIfNetworkAvailable>true</RunOnlyIfNetworkAvailable>
-  </Settings>
-  <Actions>
-    <Exec>
-      <Command>{command.split()[0]}</Command>
-      <Arguments>{' '.join(command.split()[1:])}</Arguments>
-    </Exec>
-  </Actions>
-</Task>
-"""
-        return xml
+        parts = command.split()
+        return _TASK_XML_TEMPLATE.format(
+            task_name=task_name,
+            time=schedule.get('time', '10:00'),
+            days_xml=_days_xml(tuple(schedule.get('days', []))),
+            program=parts[0],
+            arguments=' '.join(parts[1:])
+        )
 
     @staticmethod
     def print_setup_instructions():
@@ -170,8 +187,7 @@ schtasks /delete /tn "InfoSpider_News" /f
         Returns:
             True if today is MON, WED, or FRI
         """
-        today = datetime.now().strftime('%a').upper()
-        return today in ['MON', 'WED', 'FRI']
+        return bool((1 << datetime.now().weekday()) & _NEWS_CRAWL_DAYS)
 
     @staticmethod
     def should_run_papers_patents_crawl() -> bool:
@@ -181,8 +197,7 @@ schtasks /delete /tn "InfoSpider_News" /f
         Returns:
             True if today is FRI
         """
-        today = datetime.now().strftime('%a').upper()
-        return today == 'FRI'
+        return bool((1 << datetime.now().weekday()) & _PAPERS_PATENTS_CRAWL_DAYS)
 
     @staticmethod
     def get_next_run_time(task_type: str) -> Optional[str]:
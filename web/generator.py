@@ -2,11 +2,14 @@
 Static website generator module
 """
 import logging
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List
-from jinja2 import Environment, FileSystemLoader
+from typing import List, Optional
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from jinja2.environment import TemplateStream
 
 from database.models import News, Patent, Paper
 from database.db_manager import DatabaseManager
@@ -19,6 +22,79 @@ from config.settings import (
 
 logger = logging.getLogger(__name__)
 
+# Compiled templates are kept here between runs
+_JINJA_CACHE_DIR = PROJECT_ROOT / ".jinja_cache"
+# Format of the "last update" timestamp shown on every page
+_LAST_UPDATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """
+    Hard-link src to dst, falling back to a copy where linking isn't possible
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        Destination path
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return dst
+    if os.path.lexists(dst):
+        os.unlink(dst)
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Other filesystem, or no hard link support
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _remove_stale(src_dir: Path, dest_dir: Path):
+    """
+    Remove files and directories under dest_dir that no longer exist under src_dir
+
+    Args:
+        src_dir: Source directory
+        dest_dir: Copy of src_dir to prune
+    """
+    # Bottom-up, so stale directories are already emptied when reached
+    for root, dirs, files in os.walk(dest_dir, topdown=False):
+        src_root = src_dir / os.path.relpath(root, dest_dir)
+        for name in files:
+            if not os.path.lexists(src_root / name):
+                os.unlink(os.path.join(root, name))
+        for name in dirs:
+            if not os.path.isdir(src_root / name):
+                path = os.path.join(root, name)
+                if os.path.islink(path):
+                    os.unlink(path)
+                else:
+                    shutil.rmtree(path)
+
+
+def _dump_atomic(stream: TemplateStream, output_file: Path):
+    """
+    Stream a rendered page to a temporary file, then swap it in for output_file
+
+    A template error partway through leaves the previous page in place
+    instead of a half-written one.
+
+    Args:
+        stream: Template stream to write
+        output_file: Page path
+    """
+    tmp_file = output_file.with_name(f'.{output_file.name}.tmp')
+    try:
+        with open(tmp_file, 'wb') as f:
+            stream.dump(f, encoding='utf-8')
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
 
 class WebsiteGenerator:
     """Static website generator class"""
@@ -35,24 +111,45 @@ class WebsiteGenerator:
         self.output_dir = WEB_OUTPUT_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Setup Jinja2 environment
-        self.env = Environment(loader=FileSystemLoader(str(self.templates_dir)))
+        # Setup Jinja2 environment; templates don't change during a run, so
+        # skip the per-lookup mtime check and reuse compiled bytecode across runs
+        _JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self.env = Environment(
+            loader=FileSystemLoader(str(self.templates_dir)),
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache(directory=str(_JINJA_CACHE_DIR))
+        )
 
     def generate_all(self):
         """Generate all pages"""
         logger.info("Starting website generation")
 
         try:
-            # Get data from database
+            # Get data from database once; every page renders these lists.
+            # The model objects go to the templates as-is: Jinja resolves
+            # `item.attr` with getattr first, so dict copies would only add a
+            # failed lookup per access on top of the conversion
             news_list = self.db_manager.get_all_news(limit=200)
             patents_list = self.db_manager.get_all_patents(limit=200)
             papers_list = self.db_manager.get_all_papers(limit=200)
 
-            # Generate pages
-            self.generate_index(news_list, patents_list, papers_list)
-            self.generate_news_page(news_list)
-            self.generate_patents_page(patents_list)
-            self.generate_papers_page(papers_list)
+            # One timestamp for the whole site
+            last_update = datetime.now().strftime(_LAST_UPDATE_FORMAT)
+
+            # Pages are independent, so render and write them side by side
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(self.generate_index, news_list, patents_list, papers_list,
+                                    last_update=last_update),
+                    executor.submit(self.generate_news_page, news_list,
+                                    last_update=last_update),
+                    executor.submit(self.generate_patents_page, patents_list,
+                                    last_update=last_update),
+                    executor.submit(self.generate_papers_page, papers_list,
+                                    last_update=last_update),
+                ]
+                for future in futures:
+                    future.result()
 
             logger.info(f"Website generated successfully at: {self.output_dir}")
 
@@ -62,7 +159,8 @@ class WebsiteGenerator:
 
     def generate_index(self, news_list: List[News],
                       patents_list: List[Patent],
-                      papers_list: List[Paper]):
+                      papers_list: List[Paper],
+                      last_update: Optional[str] = None):
         """
         Generate index page
 
@@ -70,6 +168,7 @@ class WebsiteGenerator:
             news_list: List of all news
             patents_list: List of all patents
             papers_list: List of all papers
+            last_update: Page timestamp, the current time if not given
         """
         template = self.env.get_template('index.html')
 
@@ -78,84 +177,83 @@ class WebsiteGenerator:
         latest_patents = patents_list[:5]
         latest_papers = papers_list[:5]
 
-        html = template.render(
+        output_file = self.output_dir / 'index.html'
+        # Written chunk by chunk instead of building the whole page in memory
+        _dump_atomic(template.stream(
             site_title=SITE_TITLE,
             site_description=SITE_DESCRIPTION,
             active_page='index',
-            last_update=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            last_update=last_update or datetime.now().strftime(_LAST_UPDATE_FORMAT),
             news_count=len(news_list),
             patents_count=len(patents_list),
             papers_count=len(papers_list),
             latest_news=latest_news,
             latest_patents=latest_patents,
             latest_papers=latest_papers
-        )
-
-        output_file = self.output_dir / 'index.html'
-        output_file.write_text(html, encoding='utf-8')
+        ), output_file)
         logger.info(f"Generated: {output_file}")
 
-    def generate_news_page(self, news_list: List[News]):
+    def generate_news_page(self, news_list: List[News],
+                           last_update: Optional[str] = None):
         """
         Generate news page
 
         Args:
             news_list: List of news articles
+            last_update: Page timestamp, the current time if not given
         """
         template = self.env.get_template('news.html')
 
-        html = template.render(
+        output_file = self.output_dir / 'news.html'
+        _dump_atomic(template.stream(
             site_title=SITE_TITLE,
             site_description=SITE_DESCRIPTION,
             active_page='news',
-            last_update=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            last_update=last_update or datetime.now().strftime(_LAST_UPDATE_FORMAT),
             news_list=news_list
-        )
-
-        output_file = self.output_dir / 'news.html'
-        output_file.write_text(html, encoding='utf-8')
+        ), output_file)
         logger.info(f"Generated: {output_file}")
 
-    def generate_patents_page(self, patents_list: List[Patent]):
+    def generate_patents_page(self, patents_list: List[Patent],
+                              last_update: Optional[str] = None):
         """
         Generate patents page
 
         Args:
             patents_list: List of patents
+            last_update: Page timestamp, the current time if not given
         """
         template = self.env.get_template('patents.html')
 
-        html = template.render(
+        output_file = self.output_dir / 'patents.html'
+        _dump_atomic(template.stream(
             site_title=SITE_TITLE,
             site_description=SITE_DESCRIPTION,
             active_page='patents',
-            last_update=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            last_update=last_update or datetime.now().strftime(_LAST_UPDATE_FORMAT),
             patents_list=patents_list
-        )
-
-        output_file = self.output_dir / 'patents.html'
-        output_file.write_text(html, encoding='utf-8')
+        ), output_file)
         logger.info(f"Generated: {output_file}")
 
-    def generate_papers_page(self, papers_list: List[Paper]):
+    def generate_papers_page(self, papers_list: List[Paper],
+                             last_update: Optional[str] = None):
         """
         Generate papers page
 
         Args:
             papers_list: List of papers
+            last_update: Page timestamp, the current time if not given
         """
         template = self.env.get_template('papers.html')
 
-        html = template.render(
+        output_file = self.output_dir / 'papers.html'
+        _dump_atomic(template.stream(
             site_title=SITE_TITLE,
             site_description=SITE_DESCRIPTION,
             active_page='papers',
-            last_update=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            last_update=last_update or datetime.now().strftime(_LAST_UPDATE_FORMAT),
             papers_list=papers_list
-        )
-
-        output_file = self.output_dir / 'papers.html'
-        output_file.write_text(html, encoding='utf-8')
+        ), output_file)
         logger.info(f"Generated: {output_file}")
 
     def copy_static_files(self):
@@ -164,9 +262,11 @@ class WebsiteGenerator:
         static_dest = self.output_dir / "static"
 
         if static_src.exists():
-            if static_dest.exists():
-                shutil.rmtree(static_dest)
-            shutil.copytree(static_src, static_dest)
+            # Copied over the previous output; files linked on an earlier run
+            # are skipped, and files since removed from the source are dropped
+            shutil.copytree(static_src, static_dest, dirs_exist_ok=True,
+                            copy_function=_link_or_copy)
+            _remove_stale(static_src, static_dest)
             logger.info(f"Copied static files to: {static_dest}")
         else:
             logger.warning(f"Static directory not found: {static_src}")
@@ -202,9 +302,12 @@ Powered by Manufacturing Info Spider
     def clean_output_directory(self):
         """Clean output directory"""
         if self.output_dir.exists():
-            for item in self.output_dir.iterdir():
-                if item.is_file():
-                    item.unlink()
-                elif item.is_dir():
-                    shutil.rmtree(item)
+            # DirEntry carries the file type from the directory listing, so
+            # no extra stat() per entry
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
             logger.info(f"Cleaned output directory: {self.output_dir}")